@@ -101,7 +101,9 @@ class AluBot(commands.Bot, AluBotHelper):
         self.session: ClientSession = session
 
         self.exc_manager: ExceptionManager = ExceptionManager(self)
-        self.transposer: transposer.TransposeClient = transposer.TransposeClient(session=session)
+        self.transposer: transposer.TransposeClient = transposer.TransposeClient(
+            session=session, render_processes=0 if test else 2,
+        )
         self.disambiguator: disambiguator.Disambiguator = disambiguator.Disambiguator()
 
         self.repository_url: str = "https://github.com/Aluerie/AluBot"
@@ -111,7 +113,7 @@ class AluBot(commands.Bot, AluBotHelper):
         self.category_cogs: dict[ExtCategory, list[AluCog]] = {}
 
         self.mimic_message_user_mapping: MutableMapping[int, int] = cache.ExpiringCache(
-            seconds=datetime.timedelta(days=7).seconds,
+            seconds=datetime.timedelta(days=7).total_seconds(),
         )
 
     @override
@@ -305,6 +307,7 @@ class AluBot(commands.Bot, AluBotHelper):
             await self.dota.close()
         if hasattr(self, "lol"):
             await self.lol.close()
+        self.transposer.close()
 
         await super().close()
         # session needs to be closed the last probably
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import datetime
+import heapq
 import logging
+import uuid
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, Generic, Self, TypedDict, TypeVar, override
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Generic, NamedTuple, Self, TypedDict, TypeVar, override
 
 import asyncpg
 import discord
+import orjson
 
 from utils.database import DotRecord
 
@@ -18,6 +23,7 @@ __all__: tuple[str, ...] = (
     "Timer",
     "TimerManager",
     "TimerRecord",
+    "TimerSpec",
 )
 
 type TimerMapping = Mapping[str, Any]
@@ -32,6 +38,7 @@ class TimerRecord(DotRecord, Generic[TimerDataT]):
     created_at: datetime.datetime
     timezone: str
     data: TimerDataT
+    fires_at: datetime.datetime
 
 
 # mirror above for @classmethod .temporary
@@ -44,6 +51,16 @@ class PseudoTimerRecord(TypedDict, Generic[TimerDataT]):
     data: TimerDataT
 
 
+class TimerSpec(NamedTuple):
+    """Specification of a timer to create with `TimerManager.create_timers`."""
+
+    event: str
+    expires_at: datetime.datetime
+    data: TimerMapping
+    created_at: datetime.datetime | None = None
+    timezone: str | None = None
+
+
 log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
@@ -144,17 +161,105 @@ class Timer(Generic[TimerDataT]):
 
 
 class TimerManager:
-    """Class to create and manage timers."""
+    """Class to create and manage timers.
+
+    The database table `timers` is the durable log of the timers, while the dispatching itself is done from
+    an in-memory min-heap of the timers (loaded from the table on start), so we don't need to query the database
+    for the next timer after every single dispatch. Due timers are popped in batches and deleted with one query.
+
+    Only timers within the next `HORIZON` are kept in the heap. The rest are loaded (with an indexed `fires_at` query)
+    once the horizon is reached.
+
+    Short timers (up to `SHORT_TIMER_THRESHOLD`) never touch the database at all. They are awaited in memory
+    and journaled into a small local append-only file `JOURNAL_PATH`, which is replayed on the next start,
+    so things like short reminder snoozes survive restarts.
+    """
 
-    __slots__: tuple[str, ...] = ("_current_timer", "_have_data", "_task", "bot", "name")
+    # can `asyncio.sleep` only for up to ~48 days reliably,
+    # so we cap it at 40 days, see: http://bugs.python.org/issue20493
+    HORIZON: datetime.timedelta = datetime.timedelta(days=40)
+    SHORT_TIMER_THRESHOLD: datetime.timedelta = datetime.timedelta(seconds=60)
+    JOURNAL_PATH: Path = Path(".temp/timers.journal")
+
+    __slots__: tuple[str, ...] = (
+        "_current_timer",
+        "_heap",
+        "_horizon",
+        "_short_timers",
+        "_task",
+        "_timers",
+        "_wakeup",
+        "bot",
+        "name",
+    )
 
     def __init__(self, *, bot: AluBot) -> None:
         self.bot: AluBot = bot
 
-        self._have_data = asyncio.Event()
+        self._wakeup = asyncio.Event()
+        self._heap: list[tuple[datetime.datetime, int, Timer[TimerMapping]]] = []
+        self._timers: dict[int, Timer[TimerMapping]] = {}
+        self._horizon: datetime.datetime = datetime.datetime.min  # noqa: DTZ901 # naive UTC like `Timer.expires_at`
         self._current_timer: Timer[TimerMapping] | None = None
+        self._short_timers: dict[str, Timer[TimerMapping]] = {}
+        self.replay_journal()
         self._task = self.bot.loop.create_task(self.dispatch_timers())
 
+    def push_timer(self, timer: Timer[TimerMapping]) -> None:
+        """Put the timer (with an id, i.e. already in the database) into the in-memory heap."""
+        assert timer.id is not None
+        if timer.expires_at >= self._horizon:
+            # it will be loaded from the database when we get closer to it
+            return
+        self._timers[timer.id] = timer
+        heapq.heappush(self._heap, (timer.expires_at, timer.id, timer))
+        if self._current_timer is None or timer.expires_at < self._current_timer.expires_at:
+            # wake the dispatcher up so it can re-evaluate how long to sleep
+            self._wakeup.set()
+
+    def forget_timer(self, timer_id: int) -> None:
+        """Remove the timer from the in-memory heap (lazily - it's just skipped when popped)."""
+        self._timers.pop(timer_id, None)
+        if self._current_timer and self._current_timer.id == timer_id:
+            self._wakeup.set()
+
+    def peek_timer(self) -> Timer[TimerMapping] | None:
+        """Get the earliest timer in the heap, dropping the forgotten ones on the way."""
+        while self._heap:
+            _, timer_id, timer = self._heap[0]
+            if self._timers.get(timer_id) is timer:
+                return timer
+            heapq.heappop(self._heap)
+        return None
+
+    def pop_due_timers(self, now: datetime.datetime) -> list[Timer[TimerMapping]]:
+        """Pop all timers from the heap that should be dispatched at the moment `now`."""
+        due: list[Timer[TimerMapping]] = []
+        while (timer := self.peek_timer()) is not None and timer.expires_at <= now:
+            heapq.heappop(self._heap)
+            del self._timers[timer.id]  # type: ignore # timers in the heap always have an id
+            due.append(timer)
+        return due
+
+    async def load_timers(self) -> None:
+        """Load timers within the `HORIZON` from the database into the in-memory heap.
+
+        The fetched timers are merged into the heap rather than replacing it,
+        so timers pushed by `create_timers` while the query is running are not lost.
+        """
+        now = datetime.datetime.now(datetime.UTC)
+        self._horizon = (now + self.HORIZON).replace(tzinfo=None)
+        query = "SELECT * FROM timers WHERE fires_at < $1"
+        records: list[TimerRecord[TimerMapping]] = await self.bot.pool.fetch(query, now + self.HORIZON)
+        loaded = 0
+        for record in records:
+            if record["id"] not in self._timers:
+                timer = Timer(record=record)
+                self._timers[record["id"]] = timer
+                heapq.heappush(self._heap, (timer.expires_at, record["id"], timer))
+                loaded += 1
+        log.debug("Loaded %s timers into the heap.", loaded)
+
     async def dispatch_timers(self) -> None:
         """The main dispatch timers loop.
 
@@ -165,20 +270,25 @@ class TimerManager:
 
         try:
             while not self.bot.is_closed():
-                # can `asyncio.sleep` only for up to ~48 days reliably,
-                # so we cap it at 40 days, see: http://bugs.python.org/issue20493
-                timer = self._current_timer = await self.wait_for_active_timers(days=40)
-                log.debug("Current_timer = %s", timer)
+                self._wakeup.clear()
                 now = datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+                if now >= self._horizon:
+                    await self.load_timers()
+                if due_timers := self.pop_due_timers(now):
+                    await self.call_timers(due_timers)
+                    continue
 
-                if timer.expires_at >= now:
-                    to_sleep = (timer.expires_at - now).total_seconds()
-                    await asyncio.sleep(to_sleep)
-
-                await self.call_timer(timer)
+                timer = self._current_timer = self.peek_timer()
+                log.debug("Current_timer = %s", timer)
+                wake_up_at = self._horizon if timer is None else min(timer.expires_at, self._horizon)
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=(wake_up_at - now).total_seconds())
         except asyncio.CancelledError:
             raise
         except (OSError, discord.ConnectionClosed, asyncpg.PostgresConnectionError):
+            # the popped batch might not be deleted from the database (nor dispatched),
+            # so make the restarted task reload the heap from the database
+            self._horizon = datetime.datetime.min  # noqa: DTZ901 # naive UTC like `Timer.expires_at`
             self._task.cancel()
             self._task = self.bot.loop.create_task(self.dispatch_timers())
         except Exception as exc:
@@ -188,81 +298,35 @@ class TimerManager:
             ).set_footer(text="TimerManager.dispatch_timers")
             await self.bot.exc_manager.register_error(exc, embed)
 
-    async def wait_for_active_timers(self, *, days: int = 7) -> Timer[TimerMapping]:
-        """Wait for a timer that has expired.
+    async def call_timers(self, timers: list[Timer[TimerMapping]]) -> None:
+        """Call expired timers to dispatch them.
 
-        This will wait until a timer is expired and should be dispatched.
+        The timers are deleted from the database in one query. Only the timers that were still there get dispatched,
+        this way timers that were deleted by other queries in the meantime (i.e. `/remind delete`) are skipped.
 
         Parameters
         ----------
-        days : int
-            Number of days to look into.
-
-        Returns
-        -------
-        Timer[TimerMapping]
-            The timer that is expired and should be dispatched.
+        timers : list[Timer[TimerMapping]]
+            The timers to dispatch.
 
         """
-        timer = await self.get_active_timer(days=days)
-
-        if timer is not None:
-            self._have_data.set()
-            return timer
-
-        self._have_data.clear()
-        self._current_timer = None
-        await self._have_data.wait()
+        log.debug("Calling and Dispatching %s timers", len(timers))
 
-        return await self.get_active_timer(days=days)  # type: ignore  # bcs at this point we always have data
+        # delete the timers
+        query = "DELETE FROM timers WHERE id = ANY($1::int[]) RETURNING id"
+        deleted_ids = {row["id"] for row in await self.bot.pool.fetch(query, [timer.id for timer in timers])}
 
-    async def call_timer(self, timer: Timer) -> None:
-        """Call an expired timer to dispatch it.
+        # dispatch the events
+        for timer in timers:
+            if timer.id in deleted_ids:
+                self.dispatch_timer(timer)
 
-        Parameters
-        ----------
-        timer : Timer
-            The timer to dispatch.
-
-        """
-        log.debug("Calling and Dispatching the timer %s with event %s", timer.id, timer.event)
-
-        # delete the timer
-        query = "DELETE FROM timers WHERE id=$1"
-        await self.bot.pool.execute(query, timer.id)
-
-        # dispatch the event
+    def dispatch_timer(self, timer: Timer[TimerMapping]) -> None:
+        """Dispatch the timer event."""
+        log.debug("Dispatching the timer %s with event %s", timer.id, timer.event)
         event_name = f"{timer.event}_timer_complete"
         self.bot.dispatch(event_name, timer)
 
-    async def get_active_timer(self, *, days: int = 7) -> Timer[TimerMapping] | None:
-        """Get the most current active timer in the database.
-
-        This timer is expired and should be dispatched.
-
-        Parameters
-        ----------
-        days: int
-            The number of days to look back.
-
-        Returns
-        -------
-        Timer | None
-            The timer that is expired and should be dispatched.
-
-        """
-        query = """
-            SELECT * FROM timers
-            WHERE (expires_at AT TIME ZONE 'UTC' AT TIME ZONE timezone) < (CURRENT_TIMESTAMP + $1::interval)
-            ORDER BY expires_at
-            LIMIT 1;
-        """
-        record: TimerRecord[TimerMapping] = await self.bot.pool.fetchrow(query, datetime.timedelta(days=days))
-        if record:
-            timer = Timer(record=record)
-            return timer
-        return None
-
     async def create_timer(
         self,
         *,
@@ -274,7 +338,8 @@ class TimerManager:
     ) -> Timer:
         """Creates a timer.
 
-        Used to create a timer and put it into a database, or just dispatch it if it's a short timer.
+        Used to create a timer and put it into a database, or just schedule it in memory if it's a short timer
+        (it's only journaled into a local file then so it survives restarts).
 
         Parameters
         ----------
@@ -302,54 +367,183 @@ class TimerManager:
         Timer
 
         """
-        log.debug("Creating %s timer for %s", event, expires_at)
+        spec = TimerSpec(event=event, expires_at=expires_at, data=data, created_at=created_at, timezone=timezone)
+        return (await self.create_timers([spec]))[0]
 
-        created_at = created_at or datetime.datetime.now(datetime.UTC)
-        timezone = timezone or "UTC"
+    async def create_timers(self, specs: list[TimerSpec]) -> list[Timer]:
+        """Creates timers in bulk.
 
-        # Remove timezone information since the database does not deal with it
-        expires_at = expires_at.astimezone(datetime.UTC).replace(tzinfo=None)
-        created_at = created_at.astimezone(datetime.UTC).replace(tzinfo=None)
+        Same as `create_timer` but all timers are inserted into the database at once,
+        so bulk imports don't make a database round-trip for each timer.
 
-        timer = Timer.temporary(
-            event=event,
-            expires_at=expires_at,
-            created_at=created_at,
-            timezone=timezone,
-            data=data,
-        )
+        Parameters
+        ----------
+        specs : list[TimerSpec]
+            Specifications of the timers to create. See `create_timer` for the meaning of the fields.
+
+        Returns
+        -------
+        list[Timer]
+            Created timers in the same order as `specs`.
 
-        delta = (expires_at - created_at).total_seconds()
-        if delta <= 60:
-            # a shortcut for small timers
-            self.bot.loop.create_task(self.short_timer_optimisation(delta, timer))
-            return timer
+        """
+        timers: list[Timer[TimerMapping]] = []
+        db_timers: list[Timer[TimerMapping]] = []
+        for spec in specs:
+            log.debug("Creating %s timer for %s", spec.event, spec.expires_at)
+
+            created_at = spec.created_at or datetime.datetime.now(datetime.UTC)
+
+            # Remove timezone information since the database does not deal with it
+            expires_at = spec.expires_at.astimezone(datetime.UTC).replace(tzinfo=None)
+            created_at = created_at.astimezone(datetime.UTC).replace(tzinfo=None)
+
+            timer = Timer.temporary(
+                event=spec.event,
+                expires_at=expires_at,
+                created_at=created_at,
+                timezone=spec.timezone or "UTC",
+                data=spec.data,
+            )
+            timers.append(timer)
+
+            if expires_at - created_at <= self.SHORT_TIMER_THRESHOLD:
+                # a shortcut for small timers
+                self.schedule_short_timer(timer)
+            else:
+                db_timers.append(timer)
+
+        if not db_timers:
+            return timers
 
         query = """
-            INSERT INTO timers (event, data, expires_at, created_at, timezone)
-            VALUES ($1, $2::jsonb, $3, $4, $5)
-            RETURNING id;
+            INSERT INTO timers (id, event, data, expires_at, created_at, timezone, fires_at)
+            VALUES ($1, $2, $3::jsonb, $4, $5, $6, $7)
         """
-        row = await self.bot.pool.fetchrow(query, event, data, expires_at, created_at, timezone)
-        timer.id = row[0]
+        async with self.bot.pool.acquire() as connection, connection.transaction():
+            # reserve the ids first since `executemany` can't return them
+            ids_query = "SELECT nextval('timers_id_seq') FROM generate_series(1, $1)"
+            ids: list[int] = [row[0] for row in await connection.fetch(ids_query, len(db_timers))]
+            for timer_id, timer in zip(ids, db_timers, strict=True):
+                timer.id = timer_id
+            await connection.executemany(
+                query,
+                [
+                    (
+                        timer.id,
+                        timer.event,
+                        timer.data,
+                        timer.expires_at,
+                        timer.created_at,
+                        timer.timezone,
+                        timer.expires_at.replace(tzinfo=datetime.UTC),
+                    )
+                    for timer in db_timers
+                ],
+            )
+
+        # pushing only wakes the dispatcher up (if needed) - it re-evaluates the heap once for the whole batch
+        for timer in db_timers:
+            self.push_timer(timer)
+        return timers
+
+    def write_journal(self, entry: dict[str, Any]) -> None:
+        """Append an entry to the short timers journal.
+
+        The file is opened for every entry (short timers are rare enough) so each line hits the OS right away.
+        """
+        try:
+            self.JOURNAL_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with self.JOURNAL_PATH.open("ab") as file:
+                file.write(orjson.dumps(entry) + b"\n")
+        except OSError:
+            log.warning("Failed to write into the timers journal.", exc_info=True)
 
-        # only set the data check if it can be waited on
-        if delta <= (86400 * 40):  # 40 days
-            self._have_data.set()
+    def replay_journal(self) -> None:
+        """Schedule short timers that were journaled but not dispatched before the previous shutdown.
 
-        # check if this timer is earlier than our currently run timer
-        if self._current_timer and expires_at < self._current_timer.expires_at:
-            # cancel the task and re-run it
-            self._task.cancel()
-            self._task = self.bot.loop.create_task(self.dispatch_timers())
+        It's done synchronously - the file is tiny and it's only done once on start.
+        The journal is compacted to just the pending timers afterwards.
+        """
+        try:
+            lines = self.JOURNAL_PATH.read_bytes().splitlines()
+        except FileNotFoundError:
+            return
+
+        pending: dict[str, dict[str, Any]] = {}
+        for line in lines:
+            try:
+                entry = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                # most likely a line torn by a crash mid-write
+                log.warning("Skipping a corrupted line in the timers journal: %r", line)
+                continue
+            if entry.get("done"):
+                pending.pop(entry["key"], None)
+            else:
+                pending[entry["key"]] = entry
+
+        content = b"".join(orjson.dumps(entry) + b"\n" for entry in pending.values())
+        temp_path = self.JOURNAL_PATH.with_suffix(".tmp")
+        try:
+            temp_path.write_bytes(content)
+            temp_path.replace(self.JOURNAL_PATH)
+        except OSError:
+            log.warning("Failed to compact the timers journal.", exc_info=True)
+
+        for key, entry in pending.items():
+            timer: Timer[TimerMapping] = Timer.temporary(
+                event=entry["event"],
+                expires_at=datetime.datetime.fromisoformat(entry["expires_at"]),
+                created_at=datetime.datetime.fromisoformat(entry["created_at"]),
+                timezone=entry["timezone"],
+                data=entry["data"],
+            )
+            self.schedule_short_timer(timer, key=key)
+        log.debug("Replayed %s short timers from the journal.", len(pending))
+
+    def schedule_short_timer(self, timer: Timer[TimerMapping], *, key: str | None = None) -> None:
+        """Schedule a short timer in memory.
 
-        return timer
+        Parameters
+        ----------
+        timer : Timer[TimerMapping]
+            The short timer to schedule.
+        key : str | None
+            The journal key of the timer if it's replayed from the journal.
+            New timers get a fresh key and are written into the journal.
 
-    async def short_timer_optimisation(self, seconds: float, timer: Timer[TimerMapping]) -> None:
+        """
+        if key is None:
+            key = uuid.uuid4().hex
+            self.write_journal(
+                {
+                    "key": key,
+                    "event": timer.event,
+                    "expires_at": timer.expires_at.isoformat(),
+                    "created_at": timer.created_at.isoformat(),
+                    "timezone": timer.timezone,
+                    "data": timer.data,
+                },
+            )
+        self._short_timers[key] = timer
+        self.bot.loop.create_task(self.short_timer_optimisation(key, timer))
+
+    async def short_timer_optimisation(self, key: str, timer: Timer[TimerMapping]) -> None:
         """Optimisation for small timers, skipping the whole insert/delete from the database procedure."""
-        await asyncio.sleep(seconds)
-        event_name = f"{timer.event}_timer_complete"
-        self.bot.dispatch(event_name, timer)
+        now = datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+        await asyncio.sleep((timer.expires_at - now).total_seconds())
+        # replayed timers can be already overdue before listeners are ready
+        await self.bot.wait_until_ready()
+        self.dispatch_timer(timer)
+
+        del self._short_timers[key]
+        if self._short_timers:
+            self.write_journal({"key": key, "done": True})
+        else:
+            # nothing is pending - the journal can just start from scratch
+            with contextlib.suppress(OSError):
+                self.JOURNAL_PATH.unlink(missing_ok=True)
 
     async def get_timer_by_id(self, id: int) -> Timer[TimerMapping] | None:
         """Get a timer from its ID.
@@ -378,8 +572,9 @@ class TimerManager:
             The ID of the timer to delete.
 
         """
-        query = "DELETE * FROM timers WHERE id = $1"
+        query = "DELETE FROM timers WHERE id = $1"
         await self.bot.pool.execute(query, id)
+        self.forget_timer(id)
 
     async def get_timer_by_kwargs(self, event: str, /, **kwargs: Any) -> Timer | None:
         """Gets a timer from the database.
@@ -391,7 +586,7 @@ class TimerManager:
         event : str
             The name of the event to search for.
         **kwargs
-            Keyword arguments to search for in the database.
+            Keyword arguments to search for in the timer `data` (compared as JSON, i.e. `user_id=123`).
 
         Returns
         -------
@@ -399,9 +594,8 @@ class TimerManager:
             The timer if found, otherwise None.
 
         """
-        filtered_clause = [f"data #>> ARRAY['{key}'] = ${i}" for (i, key) in enumerate(kwargs.keys(), start=2)]
-        query = f"SELECT * FROM timers WHERE event = $1 AND {' AND '.join(filtered_clause)} LIMIT 1"
-        record: TimerRecord | None = await self.bot.pool.fetchrow(query, event, *kwargs.values())
+        query = "SELECT * FROM timers WHERE event = $1 AND data @> $2::jsonb LIMIT 1"
+        record: TimerRecord | None = await self.bot.pool.fetchrow(query, event, kwargs)
         return Timer(record=record) if record else None
 
     async def delete_timer_by_kwargs(self, event: str, /, **kwargs: Any) -> None:
@@ -414,18 +608,13 @@ class TimerManager:
         event: str
             The name of the event to search for.
         **kwargs
-            Keyword arguments to search for in the database.
+            Keyword arguments to search for in the timer `data` (compared as JSON, i.e. `user_id=123`).
 
         """
-        filtered_clause = [f"data #>> ARRAY['{key}'] = ${i}" for (i, key) in enumerate(kwargs.keys(), start=2)]
-        query = f"DELETE FROM timers WHERE event = $1 AND {' AND '.join(filtered_clause)} RETURNING id"
-        record: Any = await self.bot.pool.fetchrow(query, event, *kwargs.values())
-
-        # if the current timer is being deleted
-        if record is not None and self._current_timer and self._current_timer.id == record["id"]:
-            # cancel the task and re-run it
-            self._task.cancel()
-            self._task = self.bot.loop.create_task(self.dispatch_timers())
+        query = "DELETE FROM timers WHERE event = $1 AND data @> $2::jsonb RETURNING id"
+        record: Any = await self.bot.pool.fetchrow(query, event, kwargs)
+        if record is not None:
+            self.forget_timer(record["id"])
 
     async def fetch_timers(self) -> list[Timer]:
         """Fetch all timers from the database.
@@ -440,5 +629,8 @@ class TimerManager:
         return [Timer(record=row) for row in rows]
 
     def rerun_the_task(self) -> None:
-        self._task.cancel()
-        self._task = self.bot.loop.create_task(self.bot.dispatch_timers())
+        """Make the dispatcher re-evaluate the next timer.
+
+        Timers deleted from the database by other queries are skipped at the dispatch time anyway.
+        """
+        self._wakeup.set()
@@ -9,6 +9,7 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
+from bot import TimerSpec
 from utils import const, converters, errors, formats, pages, timezones
 
 from ._base import CommunityCog
@@ -221,9 +222,9 @@ class Birthday(CommunityCog, emote=const.Emote.peepoHappyDank):
         query = """
             DELETE FROM timers
             WHERE event = 'birthday'
-            AND data #>> '{user_id}' = $1;
+            AND data @> $1::jsonb;
         """
-        status = await self.bot.pool.execute(query, str(user_id))
+        status = await self.bot.pool.execute(query, {"user_id": user_id})
 
         current_timer = self.bot._current_timer
         if current_timer and current_timer.event == "timer" and current_timer.data:
@@ -268,9 +269,9 @@ class Birthday(CommunityCog, emote=const.Emote.peepoHappyDank):
         query = """
             SELECT * FROM timers
             WHERE event = 'birthday'
-            AND data #>> '{user_id}' = $1;
+            AND data @> $1::jsonb;
         """
-        row: TimerRecord[BirthdayTimerData] | None = await self.bot.pool.fetchrow(query, str(member.id))
+        row: TimerRecord[BirthdayTimerData] | None = await self.bot.pool.fetchrow(query, {"user_id": member.id})
 
         embed = discord.Embed(colour=member.color)
         embed.set_author(name=f"{member.display_name}'s birthday status", icon_url=member.display_avatar.url)
@@ -286,6 +287,7 @@ class Birthday(CommunityCog, emote=const.Emote.peepoHappyDank):
         """Send birthday notifications."""
         user_id = timer.data["user_id"]
         year = timer.data["year"]
+        specs: list[TimerSpec] = []
 
         guild = self.community.guild
 
@@ -338,22 +340,27 @@ class Birthday(CommunityCog, emote=const.Emote.peepoHappyDank):
             await self.birthday_channel.send(content=content, embed=embed)
 
             # create remove roles timer
-            await self.bot.create_timer(
-                event="remove_birthday_role",
-                expires_at=timer.expires_at + datetime.timedelta(days=1),
-                created_at=timer.created_at,
-                timezone=timer.timezone,
-                data=timer.data,
+            specs.append(
+                TimerSpec(
+                    event="remove_birthday_role",
+                    expires_at=timer.expires_at + datetime.timedelta(days=1),
+                    data=timer.data,
+                    created_at=timer.created_at,
+                    timezone=timer.timezone,
+                ),
             )
 
         # create next year timer
-        await self.bot.create_timer(
-            event="birthday",
-            expires_at=timer.expires_at.replace(year=timer.expires_at.year + 1),
-            created_at=timer.created_at,
-            timezone=timer.timezone,
-            data=timer.data,
+        specs.append(
+            TimerSpec(
+                event="birthday",
+                expires_at=timer.expires_at.replace(year=timer.expires_at.year + 1),
+                data=timer.data,
+                created_at=timer.created_at,
+                timezone=timer.timezone,
+            ),
         )
+        await self.bot.create_timers(specs)
 
     @commands.Cog.listener("on_remove_birthday_role_timer_complete")
     async def birthday_cleanup(self, timer: Timer[BirthdayTimerData]) -> None:
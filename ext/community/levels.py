@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Any, Literal, TypedDict, override
 import discord
 from discord import app_commands
 from discord.ext import commands
-from PIL import Image, ImageDraw, ImageFilter, ImageFont
+from PIL import Image, ImageDraw, ImageFilter
 
 from bot import aluloop
 from utils import const, errors, formats, pages
@@ -80,7 +80,7 @@ async def rank_image(
         fill=member.color.to_rgb(),
     )
 
-    font = ImageFont.truetype("./assets/fonts/Inter-Black-slnt=0.ttf", 60)
+    font = bot.transposer.font("./assets/fonts/Inter-Black-slnt=0.ttf", 60)
     d.text((width / 4, 0), member.display_name, fill=(255, 255, 255), font=font)
     d.text((width / 4, height * 2 / 6), f"{place_str} rank", fill=(255, 255, 255), font=font)
     d.text((width / 4, height * 3 / 6), f"LVL {lvl}", fill=(255, 255, 255), font=font)
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, TypedDict
 
 import discord
 from discord.ext import commands
-from PIL import Image, ImageDraw, ImageFilter, ImageFont
+from PIL import Image, ImageDraw, ImageFilter
 
 from utils import const
 
@@ -48,13 +48,13 @@ class Welcome(CommunityCog):
 
             image.paste(avatar, (left, top), mask_im)
 
-            font = ImageFont.truetype("./assets/fonts/Inter-Black-slnt=0.ttf", 80)
+            font = self.bot.transposer.font("./assets/fonts/Inter-Black-slnt=0.ttf", 80)
             d = ImageDraw.Draw(image)
             msg = member.display_name
             w1, h1 = self.bot.transposer.get_text_wh(msg, font)
             d.text(((width - w1) / 1 - 10, (height - h1) / 1 - 10), msg, fill=(255, 255, 255), font=font)
 
-            font = ImageFont.truetype("./assets/fonts/MonsieurLaDoulaise-Regular.ttf", 90)
+            font = self.bot.transposer.font("./assets/fonts/MonsieurLaDoulaise-Regular.ttf", 90)
             msg = "Welcome !"
             w2, h2 = self.bot.transposer.get_text_wh(msg, font)
             d.text(((width - w2) / 1 - 10, (height - h2) / 1 - 10 - h1 - 10), msg, fill=(255, 255, 255), font=font)
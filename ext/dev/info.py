@@ -15,12 +15,13 @@ import discord
 import psutil
 from discord import app_commands
 
-from utils import const
+from utils import cache, const, errors
 
 from ._base import DevBaseCog
 
 if TYPE_CHECKING:
     from bot import AluBot
+    from utils.database import TimingStats
 
 log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
@@ -125,6 +126,93 @@ class DevInformation(DevBaseCog):
         await interaction.response.defer()
         await interaction.followup.send(file=discord.File(".temp/alubot.log"))
 
+    @system_group.command(name="caches")
+    async def system_caches(self, interaction: discord.Interaction[AluBot], flush: str | None = None) -> None:
+        """🔬 (#Hideout) Get stats of bot's `@cache.cache` caches or flush one of them.
+
+        Parameters
+        ----------
+        flush
+            Qualified name of the cache to flush. Use "all" to flush every cache.
+        """
+        if flush is not None:
+            if flush == "all":
+                to_flush = list(cache.registry.values())
+            elif flush in cache.registry:
+                to_flush = [cache.registry[flush]]
+            else:
+                msg = f"There is no cache named `{flush}`."
+                raise errors.BadArgument(msg)
+            for cached_func in to_flush:
+                cached_func.clear()
+
+        lines = []
+        for name, cached_func in cache.registry.items():
+            stats = cached_func.get_stats()
+            total = stats.hits + stats.misses
+            hit_rate = f"{stats.hits / total:.0%}" if total else "-"
+            lines.append(
+                f"\N{BLACK CIRCLE} `{name}`\n"
+                f"size: {stats.size} | hits: {stats.hits} | misses: {stats.misses} | "
+                f"hit rate: {hit_rate} | failed: {stats.failed}",
+            )
+
+        embed = discord.Embed(
+            colour=const.Colour.blueviolet,
+            title="Bot's Caches",
+            description="\n".join(lines) or "No caches are registered.",
+        )
+        if flush is not None:
+            embed.set_footer(text=f"Flushed: {flush}")
+        await interaction.response.send_message(embed=embed)
+
+    @system_caches.autocomplete("flush")
+    async def system_caches_autocomplete(
+        self, interaction: discord.Interaction[AluBot], current: str,
+    ) -> list[app_commands.Choice[str]]:
+        """Autocomplete for `/system caches` command."""
+        names = ["all", *cache.registry]
+        return [app_commands.Choice(name=name, value=name) for name in names if current.lower() in name.lower()][:25]
+
+    @system_group.command(name="database")
+    async def system_database(
+        self, interaction: discord.Interaction[AluBot], reset: bool = False,  # noqa: FBT001, FBT002
+    ) -> None:
+        """🔬 (#Hideout) Get stats of bot's database connection pool.
+
+        Parameters
+        ----------
+        reset
+            Whether to reset the collected timings after showing them.
+        """
+        pool = self.bot.pool
+        metrics = pool.metrics
+
+        def timing(stats: TimingStats) -> str:
+            return f"count: {stats.count} | mean: {stats.mean * 1000:.2f}ms | max: {stats.max * 1000:.2f}ms"
+
+        embed = (
+            discord.Embed(colour=const.Colour.blueviolet, title="Database Connection Pool")
+            .add_field(
+                name="Connections",
+                value=(
+                    f"\N{BLACK CIRCLE} Open: {pool.get_size()} (idle: {pool.get_idle_size()})\n"
+                    f"\N{BLACK CIRCLE} Min/Max: {pool.get_min_size()}/{pool.get_max_size()}"
+                ),
+                inline=False,
+            )
+            .add_field(name="Acquire wait", value=timing(metrics.acquire_wait), inline=False)
+            .add_field(
+                name="Query time",
+                value=f"{timing(metrics.query_time)} | failed: {metrics.failed_queries}",
+                inline=False,
+            )
+        )
+        if reset:
+            metrics.reset()
+            embed.set_footer(text="Timings are reset.")
+        await interaction.response.send_message(embed=embed)
+
     @system_group.command(name="health")
     async def system_health(self, interaction: discord.Interaction[AluBot]) -> None:
         """🔬 (#Hideout) Get bot's health status."""
@@ -5,9 +5,11 @@ from typing import TYPE_CHECKING, NotRequired, TypedDict
 
 if TYPE_CHECKING:
     import discord
-    from PIL import Image
 
     from bot import AluBot
+    from utils.transposer import EncodedImage
+
+    from .notifications import EditTuple
 
 
 __all__ = (
@@ -19,7 +21,6 @@ __all__ = (
 
 class RecipientKwargs(TypedDict):
     embed: discord.Embed
-    file: discord.File
     username: NotRequired[str]
     avatar_url: NotRequired[str]
 
@@ -41,16 +42,16 @@ class BaseMatchToSend(abc.ABC):
         # self.preview_url: str = preview_url
 
     @abc.abstractmethod
-    async def notification_image(self) -> Image.Image:
+    async def notification_image(self) -> EncodedImage:
         """Get notification image that will be `set_image` into embed."""
 
     @abc.abstractmethod
-    async def insert_into_game_messages(self, message_id: int, channel_id: int) -> None:
-        """Insert the match to messages table so we can edit it later."""
+    async def insert_into_game_messages(self, messages: list[EditTuple]) -> None:
+        """Insert the sent messages into the game messages table so we can edit them later."""
 
     @abc.abstractmethod
-    async def webhook_send_kwargs(self) -> RecipientKwargs:
-        """Get embed and file."""
+    async def webhook_send_kwargs(self) -> tuple[EncodedImage, RecipientKwargs]:
+        """Get the encoded notification image and the rest of webhook send kwargs (embed, username, etc)."""
         # image = await self.notification_image()
 
         # title = f"{self.player_name} - {self.character_name}"
@@ -62,5 +63,7 @@ class BaseMatchToEdit(abc.ABC):
         self.bot: AluBot = bot
 
     @abc.abstractmethod
-    async def edit_notification_image(self, embed_image_url: str, colour: discord.Colour) -> Image.Image:
+    async def edit_notification_image(
+        self, embed_image_url: str, colour: discord.Colour, filename: str,
+    ) -> EncodedImage:
         """Edit the notification image."""
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING, Any, NamedTuple, TypedDict
 
@@ -11,6 +12,7 @@ from . import FPCCog
 
 if TYPE_CHECKING:
     from bot import AluBot
+    from utils.transposer import EncodedImage
 
     from .models import BaseMatchToEdit, BaseMatchToSend
 
@@ -22,6 +24,11 @@ if TYPE_CHECKING:
         channel_id: int
         spoil: bool
 
+    class NotifiedChannelsQueryRow(TypedDict):
+        match_id: int
+        key: int
+        channel_id: int
+
     import twitchio
 
 __all__ = (
@@ -51,6 +58,8 @@ class BaseNotifications(FPCCog):
         self.prefix: str = prefix
 
         self.message_cache: dict[int, discord.WebhookMessage] = {}
+        # `(match_id, key, channel_id)` of already sent notifications for currently live matches
+        self.notified_channels: set[tuple[int, int, int]] = set()
 
     async def get_player_streams(self, twitch_category_id: str, player_ids: list[int]) -> dict[int, twitchio.Stream]:
         """Get `player_id` for favourite FPC streams that are currently live on Twitch."""
@@ -72,30 +81,89 @@ class BaseNotifications(FPCCog):
         }
         return player_streams
 
-    async def send_match(self, match: BaseMatchToSend, recipients: list[RecipientTuple]) -> None:
-        send_kwargs = await match.webhook_send_kwargs()
+    async def prefetch_notified_channels(self, match_ids: list[int], *, key_column: str) -> None:
+        """Fetch all channels that were already notified about the players in the given live matches.
 
-        for recipient in recipients:
-            try:
+        This is one `ANY` query per tick instead of a `NOT channel_id = ANY(...)` subquery
+        per every candidate player.
+
+        Parameters
+        ----------
+        match_ids
+            Match IDs of currently live matches.
+        key_column
+            Column in `{self.prefix}_messages` table that identifies the player within the match,
+            i.e. `friend_id` for Dota 2 or `champion_id` for League of Legends.
+        """
+        query = f"""
+            SELECT match_id, {key_column} AS key, channel_id
+            FROM {self.prefix}_messages
+            WHERE match_id = ANY($1::bigint[])
+        """
+        rows: list[NotifiedChannelsQueryRow] = await self.bot.pool.fetch(query, match_ids)
+        self.notified_channels = {(row["match_id"], row["key"], row["channel_id"]) for row in rows}
+
+    def exclude_notified_channels(
+        self, match_id: int, key: int, recipients: list[RecipientTuple],
+    ) -> list[RecipientTuple]:
+        """Filter out recipients that already got the notification for this match+player combo."""
+        return [r for r in recipients if (match_id, key, r.channel_id) not in self.notified_channels]
+
+    async def send_match(
+        self,
+        match: BaseMatchToSend,
+        recipients: list[RecipientTuple],
+        *,
+        max_concurrency: int = 8,
+    ) -> None:
+        """Send the match notification to all recipient channels.
+
+        Channels are served concurrently (up to `max_concurrency` at once) so one popular player+character combo
+        doesn't delay every other match in the tick. Rate limits of each webhook are respected by discord.py's
+        webhook adapter. A failure in one channel is reported to the developers and does not abort the others.
+        """
+        image, send_kwargs = await match.webhook_send_kwargs()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def send_to_recipient(recipient: RecipientTuple) -> EditTuple | None:
+            async with semaphore:
                 channel = self.bot.get_channel(recipient.channel_id) or await self.bot.fetch_channel(
                     recipient.channel_id,
                 )
-            except discord.NotFound:
-                raise
-
-            assert isinstance(channel, discord.TextChannel)
-            try:
+                assert isinstance(channel, discord.TextChannel)
                 mimic = mimics.Mimic.from_channel(self.bot, channel)
-                message = await mimic.send(wait=True, report=True, **send_kwargs)
-            except Exception as exc:
-                raise exc
-            else:
-                if recipient.spoil:
-                    self.message_cache[message.id] = message
-                    await match.insert_into_game_messages(message.id, channel.id)
+                message = await mimic.send(
+                    wait=True,
+                    report=True,
+                    file=image.to_file(),
+                    **send_kwargs,
+                )
+
+            if recipient.spoil:
+                self.message_cache[message.id] = message
+                return EditTuple(channel_id=channel.id, message_id=message.id)
+            return None
+
+        results = await asyncio.gather(*(send_to_recipient(r) for r in recipients), return_exceptions=True)
+
+        messages_to_edit: list[EditTuple] = []
+        for recipient, result in zip(recipients, results, strict=True):
+            if isinstance(result, Exception):
+                embed = discord.Embed(
+                    colour=0xEF7A85,
+                    description=f"Failed to send FPC notification to channel_id=`{recipient.channel_id}`.",
+                ).set_footer(text=f"{self.__class__.__name__}.send_match")
+                await self.bot.exc_manager.register_error(result, embed)
+            elif isinstance(result, BaseException):
+                raise result
+            elif result is not None:
+                messages_to_edit.append(result)
+
+        if messages_to_edit:
+            await match.insert_into_game_messages(messages_to_edit)
 
     async def edit_match(self, match: BaseMatchToEdit, edits: list[EditTuple]) -> None:
-        new_image_file: discord.File | None = None
+        new_image: EncodedImage | None = None
 
         for edit in edits:
             try:
@@ -110,7 +178,7 @@ class BaseNotifications(FPCCog):
                     raise
 
             embed = message.embeds[0]
-            if new_image_file is None:
+            if new_image is None:
                 embed_image_url = embed.image.url
                 colour = embed.colour
                 if not embed_image_url:
@@ -124,17 +192,15 @@ class BaseNotifications(FPCCog):
 
                 new_filename = f"edited-{old_filename}.png"
                 log.debug(new_filename)
-                new_image = await match.edit_notification_image(embed_image_url, colour)
-
-                new_image_file = self.bot.transposer.image_to_file(new_image, filename=new_filename)
+                new_image = await match.edit_notification_image(embed_image_url, colour, new_filename)
             else:
-                # already have the file object from some other channel message editing
+                # already have the encoded image from some other channel message editing
                 # since the image should be same everywhere
                 pass
 
-            embed.set_image(url=f"attachment://{new_image_file.filename}")
+            embed.set_image(url=f"attachment://{new_image.filename}")
             try:
-                await message.edit(embed=embed, attachments=[new_image_file])
+                await message.edit(embed=embed, attachments=[new_image.to_file()])
             except discord.Forbidden:
                 raise
             else:
@@ -214,6 +214,15 @@ class BaseSettings(FPCCog):
         # setup messages cache
         self.setup_messages_cache: dict[int, AluView] = {}
 
+    def dispatch_settings_update(self) -> None:
+        """Let the notification workers know that FPC subscriptions for this game have changed.
+
+        Should be called after every write into
+        `{self.prefix}_settings`, `_favourite_players`, `_favourite_characters`, `_players` and `_accounts` tables.
+        The listener is `on_fpc_settings_update(prefix: str)`.
+        """
+        self.bot.dispatch("fpc_settings_update", self.prefix)
+
     # fpc database management related functions ########################################################################
 
     async def check_if_account_already_in_database(self, account_id: AccountIDType) -> None:
@@ -307,6 +316,7 @@ class BaseSettings(FPCCog):
         columns = ", ".join(database_dict.keys())
         query = f"INSERT INTO {self.prefix}_accounts ({columns}) VALUES ({dollars})"
         await interaction.client.pool.execute(query, *database_dict.values())
+        self.dispatch_settings_update()
 
         response_embed = (
             discord.Embed(colour=self.colour, title="Successfully added the account to the database")
@@ -633,6 +643,7 @@ class BaseSettings(FPCCog):
         except asyncpg.UniqueViolationError:
             msg = f"Player {player_display_name} was already in your favourite list."
             raise errors.BadArgument(msg) from None
+        self.dispatch_settings_update()
 
         embed = discord.Embed(colour=self.colour).add_field(
             name="Successfully added a player to your favourites.",
@@ -648,6 +659,7 @@ class BaseSettings(FPCCog):
         query = f"DELETE FROM {self.prefix}_favourite_players WHERE guild_id=$1 AND player_id=$2"
         result = await interaction.client.pool.execute(query, interaction.guild_id, player_id)
         if result == "DELETE 1":
+            self.dispatch_settings_update()
             embed = discord.Embed(
                 colour=self.colour,
                 title="Successfully removed the player from your favourites.",
@@ -671,6 +683,7 @@ class BaseSettings(FPCCog):
         except asyncpg.UniqueViolationError:
             msg = f"{self.character_singular.capitalize()} {character.display_name} was already in your favourite list."
             raise errors.BadArgument(msg) from None
+        self.dispatch_settings_update()
 
         embed = discord.Embed(colour=self.colour).add_field(
             name=f"Successfully added a {self.character_singular} to your favourites.",
@@ -685,6 +698,7 @@ class BaseSettings(FPCCog):
         query = f"DELETE FROM {self.prefix}_favourite_characters WHERE guild_id=$1 AND character_id=$2"
         result = await interaction.client.pool.execute(query, interaction.guild_id, character.id)
         if result == "DELETE 1":
+            self.dispatch_settings_update()
             embed = discord.Embed(
                 colour=self.colour,
                 title=f"Successfully removed a {self.character_singular} from your favourites.",
@@ -730,7 +744,7 @@ class BaseSettings(FPCCog):
         favourite_character_ids: list[int] = [
             character_id for (character_id,) in await self.bot.pool.fetch(query, guild_id)
         ]
-        favourite_characters = [await self.characters.by_id(i) for i in favourite_character_ids]
+        favourite_characters = await self.characters.by_ids(favourite_character_ids)
         favourite_character_names = (
             "\n".join([f"{c.emote} {c.display_name}" for c in favourite_characters]) or "Empty list"
         )
@@ -94,6 +94,7 @@ class SetupChannel(FPCView):
                 SET channel_id=$3;
         """
         await interaction.client.pool.execute(query, channel.guild.id, channel.guild.name, channel.id)
+        self.cog.dispatch_settings_update()
 
         self.embed.set_field_at(
             0, name=f"Channel {formats.tick(bool(channel))}", value=channel.mention if channel else "Not set",
@@ -131,6 +132,7 @@ class SetupMisc(FPCView):
             RETURNING {setting}
         """
         new_value: bool = await interaction.client.pool.fetchval(query, interaction.guild_id)
+        self.cog.dispatch_settings_update()
 
         old_field_name = self.embed.fields[field_index].name
         assert isinstance(old_field_name, str)
@@ -196,6 +198,7 @@ class SetupMisc(FPCView):
         # Disable the Channel
         query = f"DELETE FROM {self.cog.prefix}_settings WHERE guild_id=$1"
         await interaction.client.pool.execute(query, interaction.guild_id)
+        self.cog.dispatch_settings_update()
 
         response_embed = discord.Embed(
             colour=discord.Colour.green(),
@@ -503,6 +506,7 @@ class AddRemoveButton(discord.ui.Button[SetupCharactersPaginator | SetupCharacte
                 ON CONFLICT DO NOTHING
             """
         await interaction.client.pool.execute(query, interaction.guild.id, self.object_id)
+        self.menu.cog.dispatch_settings_update()
 
         # Edit the message with buttons
         self.is_favourite = not self.is_favourite
@@ -561,6 +565,7 @@ class RemoveAllAccountsButton(discord.ui.Button[DatabaseRemoveView]):
     async def callback(self, interaction: discord.Interaction[AluBot]) -> None:
         query = f"DELETE FROM {self.cog.prefix}_players WHERE player_id=$1"
         result: str = await interaction.client.pool.execute(query, self.player_id)
+        self.cog.dispatch_settings_update()
 
         if result != "DELETE 1":
             msg = "Error deleting this player from the database."
@@ -597,6 +602,7 @@ class RemoveAccountButton(discord.ui.Button[DatabaseRemoveView]):
     async def callback(self, interaction: discord.Interaction[AluBot]) -> None:
         query = f"DELETE FROM {self.cog.prefix}_accounts WHERE {self.account_id_column} = $1"
         result: str = await interaction.client.pool.execute(query, self.account_id)
+        self.cog.dispatch_settings_update()
         if result != "DELETE 1":
             msg = "Error deleting this account from the database."
             raise errors.BadArgument(msg)
@@ -201,6 +201,7 @@ class FPCDatabaseManagement(FPCCog):
                 if user.display_name != row["display_name"]:
                     query = f"UPDATE {table_name} SET display_name=$1 WHERE player_id=$3"
                     await self.bot.pool.execute(query, user.display_name, row["player_id"])
+                    self.bot.dispatch("fpc_settings_update", table_name.removesuffix("_players"))
         # TODO: periodic timer - create a new one
         # TODO: maybe standardize the process of periodic timers
         # TODO: remove twitch_check from other folders
@@ -5,12 +5,14 @@ import datetime
 import logging
 import math
 import re
-from typing import TYPE_CHECKING, Literal, TypedDict, override
+from io import BytesIO
+from typing import TYPE_CHECKING, Literal, NamedTuple, TypedDict, override
 
 import discord
-from PIL import Image, ImageDraw, ImageFont, ImageOps
+from PIL import Image, ImageDraw, ImageOps
 
 from utils import const, formats
+from utils.transposer import TransposeClient
 
 from ..base_classes import BaseMatchToEdit, BaseMatchToSend
 
@@ -18,8 +20,9 @@ if TYPE_CHECKING:
     from bot import AluBot
     from utils.dota import Hero, PseudoHero
     from utils.dota.schemas import stratz
+    from utils.transposer import EncodedImage
 
-    from ..base_classes import RecipientKwargs
+    from ..base_classes import EditTuple, RecipientKwargs
 
 
 __all__ = ("MatchToSend", "NotCountedMatchToEdit", "StratzMatchToEdit")
@@ -40,6 +43,62 @@ send_log = logging.getLogger("send_dota_fpc")
 edit_log = logging.getLogger("edit_dota_fpc")
 
 
+class MatchToSendImageSpec(NamedTuple):
+    """Render spec for `build_match_to_send_image`."""
+
+    canvas: Image.Image
+    hero_images: list[Image.Image]
+    colour: str
+    player_hero_text: str
+    twitch_status: str
+
+
+def build_match_to_send_image(spec: MatchToSendImageSpec) -> Image.Image:
+    """Image Builder for `MatchToSend` notification."""
+    send_log.debug("`build_notification_image` is starting")
+
+    canvas = spec.canvas
+    canvas_w, canvas_h = canvas.size
+    draw = ImageDraw.Draw(canvas)
+
+    topbar_h = 70
+
+    def draw_picked_heroes() -> None:
+        """Draw picked heroes in the match."""
+        rectangle = Image.new("RGB", (canvas_w, topbar_h), spec.colour)
+        ImageDraw.Draw(rectangle)
+        canvas.paste(rectangle)
+
+        hero_w, _hero_h = const.Dota.HERO_TOPBAR_ICON_SIZE  # hero images come pre-resized from the icon atlas
+        for count, img in enumerate(spec.hero_images):
+            img = ImageOps.expand(img, border=(0, 3, 0, 0), fill=const.Dota.PLAYER_COLOUR_MAP[count])
+            extra_space = 0 if count < 5 else 20  # math 640 - 62 * 10 = 20 where 640 is initial resolution.
+            canvas.paste(img, (count * hero_w + extra_space, 0))
+
+    draw_picked_heroes()
+
+    def draw_player_hero_text() -> None:
+        """Draw "Player - Hero" text in the middle."""
+        font = TransposeClient.font("./assets/fonts/Inter-Black-slnt=0.ttf", 33)
+
+        text = spec.player_hero_text
+        w, _h = TransposeClient.get_text_wh(text, font)
+        draw.text(((canvas_w - w) / 2, 35), text, font=font, align="center")
+
+    draw_player_hero_text()
+
+    def draw_twitch_status() -> None:
+        """Write twitch status, like Live / Offline / NoTwitch."""
+        font = TransposeClient.font("./assets/fonts/Inter-Black-slnt=0.ttf", 13)
+        text = spec.twitch_status
+        w, h = TransposeClient.get_text_wh(text, font)
+        draw.text(xy=(canvas_w - w, topbar_h + 1 + h), text=text, font=font, fill=spec.colour)
+
+    draw_twitch_status()
+
+    return canvas
+
+
 class MatchToSend(BaseMatchToSend):
     def __init__(
         self,
@@ -110,70 +169,33 @@ class MatchToSend(BaseMatchToSend):
         }
 
     @override
-    async def notification_image(self, twitch_data: TwitchData, colour: discord.Colour) -> Image.Image:
+    async def notification_image(self, twitch_data: TwitchData, colour: discord.Colour, filename: str) -> EncodedImage:
         send_log.debug("`get_notification_image` is starting")
         # prepare stuff for the following PIL procedures
-        canvas = await self.bot.transposer.url_to_image(twitch_data["preview_url"])
-        heroes = [await self.bot.dota.heroes.by_id(id) for id in self.hero_ids]
-        hero_images = [await self.bot.transposer.url_to_image(hero.topbar_icon_url) for hero in heroes]
-
-        def build_notification_image() -> Image.Image:
-            """Image Builder."""
-            send_log.debug("`build_notification_image` is starting")
-
-            canvas_w, canvas_h = canvas.size
-            draw = ImageDraw.Draw(canvas)
-
-            topbar_h = 70
-
-            def draw_picked_heroes() -> None:
-                """Draw picked heroes in the match."""
-                rectangle = Image.new("RGB", (canvas_w, topbar_h), str(colour))
-                ImageDraw.Draw(rectangle)
-                canvas.paste(rectangle)
-
-                hero_w, hero_h = (62, 35)
-                for count, img in enumerate(hero_images):
-                    img = img.resize((hero_w, hero_h))
-                    img = ImageOps.expand(img, border=(0, 3, 0, 0), fill=const.Dota.PLAYER_COLOUR_MAP[count])
-                    extra_space = 0 if count < 5 else 20  # math 640 - 62 * 10 = 20 where 640 is initial resolution.
-                    canvas.paste(img, (count * hero_w + extra_space, 0))
-
-            draw_picked_heroes()
-
-            def draw_player_hero_text() -> None:
-                """Draw "Player - Hero" text in the middle."""
-                font = ImageFont.truetype("./assets/fonts/Inter-Black-slnt=0.ttf", 33)
-
-                text = f"{twitch_data['display_name']} - {self.player_hero.display_name}"
-                w, _h = self.bot.transposer.get_text_wh(text, font)
-                draw.text(((canvas_w - w) / 2, 35), text, font=font, align="center")
-
-            draw_player_hero_text()
-
-            def draw_twitch_status() -> None:
-                """Write twitch status, like Live / Offline / NoTwitch."""
-                font = ImageFont.truetype("./assets/fonts/Inter-Black-slnt=0.ttf", 13)
-                text = twitch_data["twitch_status"]
-                w, h = self.bot.transposer.get_text_wh(text, font)
-                draw.text(xy=(canvas_w - w, topbar_h + 1 + h), text=text, font=font, fill=str(colour))
-
-            draw_twitch_status()
-
-            return canvas
+        size = const.Dota.HERO_TOPBAR_ICON_SIZE
+        canvas, hero_images = await asyncio.gather(
+            self.bot.transposer.url_to_image(twitch_data["preview_url"]),
+            asyncio.gather(*(self.bot.dota.heroes.icon_tile(id, size) for id in self.hero_ids)),
+        )
 
-        return await asyncio.to_thread(build_notification_image)
+        spec = MatchToSendImageSpec(
+            canvas=canvas,
+            hero_images=hero_images,
+            colour=str(colour),
+            player_hero_text=f"{twitch_data['display_name']} - {self.player_hero.display_name}",
+            twitch_status=twitch_data["twitch_status"],
+        )
+        return await self.bot.transposer.render(build_match_to_send_image, spec, filename=filename)
 
     @override
-    async def webhook_send_kwargs(self) -> RecipientKwargs:
+    async def webhook_send_kwargs(self) -> tuple[EncodedImage, RecipientKwargs]:
         send_log.debug("Creating embed + file for Notification match")
 
         twitch_data = await self.get_twitch_data()
 
-        notification_image = await self.notification_image(twitch_data, twitch_data["colour"])
         title = f"{twitch_data['display_name']} - {self.player_hero.display_name}"
         filename = twitch_data["twitch_status"] + "-" + re.sub(r"[_' ]", "", title) + ".png"
-        image_file = self.bot.transposer.image_to_file(notification_image, filename=filename)
+        image = await self.notification_image(twitch_data, twitch_data["colour"], filename)
         embed = (
             discord.Embed(
                 colour=twitch_data["colour"],
@@ -186,27 +208,175 @@ class MatchToSend(BaseMatchToSend):
             )
             .set_author(name=title, url=twitch_data["url"], icon_url=twitch_data["logo_url"])
             .set_thumbnail(url=self.player_hero.topbar_icon_url)
-            .set_image(url=f"attachment://{image_file.filename}")
+            .set_image(url=f"attachment://{image.filename}")
             .set_footer(text=f"watch_server {self.server_steam_id}")
         )  # | dota2://matchid={self.match_id}&matchtime={matchtime}") # but it's not really convenient.
-        return {
+        return image, {
             "embed": embed,
-            "file": image_file,
             "username": title,
             "avatar_url": self.player_hero.topbar_icon_url,
         }
 
     @override
-    async def insert_into_game_messages(self, message_id: int, channel_id: int) -> None:
+    async def insert_into_game_messages(self, messages: list[EditTuple]) -> None:
         query = """
             INSERT INTO dota_messages (message_id, channel_id, match_id, friend_id, hero_id, player_name)
             VALUES ($1, $2, $3, $4, $5, $6)
         """
-        await self.bot.pool.execute(
-            query, message_id, channel_id, self.match_id, self.friend_id, self.player_hero.id, self.player_name,
+        await self.bot.pool.executemany(
+            query,
+            [
+                (m.message_id, m.channel_id, self.match_id, self.friend_id, self.player_hero.id, self.player_name)
+                for m in messages
+            ],
         )
 
 
+class StratzMatchToEditImageSpec(NamedTuple):
+    """Render spec for `build_stratz_match_to_edit_image`."""
+
+    canvas: Image.Image
+    colour: str
+    item_icon_images: list[Image.Image]
+    item_timings: list[str]
+    neutral_item_image: Image.Image
+    ability_icon_images: list[Image.Image]
+    kda: str
+    outcome: str
+    talents: list[tuple[str, str]]  # (display_name, fill colour)
+    facet_name: str
+    facet_colour: str
+    facet_icon_image: Image.Image
+
+
+def build_stratz_match_to_edit_image(spec: StratzMatchToEditImageSpec) -> Image.Image:
+    """Image Builder for `StratzMatchToEdit` edited notification."""
+    edit_log.debug("Building edited notification message.")
+    canvas = spec.canvas
+    canvas_w, canvas_h = canvas.size
+    draw = ImageDraw.Draw(canvas)
+
+    def draw_items_row() -> int:
+        """Draw items on a single row.
+
+        Returns height of the row to align other elements in the canvas.
+        """
+        # the height for items row, meaning items themselves are of this height. Images come pre-resized.
+        item_w, h = const.Dota.ITEM_ICON_SIZE
+        font = TransposeClient.font("./assets/fonts/Inter-Black-slnt=0.ttf", 19)  # font for item timings
+
+        # rectangle for the row
+        rectangle = Image.new("RGB", (canvas_w, h), spec.colour)
+        ImageDraw.Draw(rectangle)
+        canvas.paste(rectangle, (0, canvas_h - h))
+
+        # item images
+        for count, img in enumerate(spec.item_icon_images):
+            canvas.paste(img, (count * item_w, canvas_h - h))
+
+        # item timings
+        for count, item_timing in enumerate(spec.item_timings):
+            if item_timing:
+                text_w, text_h = TransposeClient.get_text_wh(item_timing, font)
+                draw.text((count * item_w, canvas_h - text_h), item_timing, font=font, align="left")
+
+        canvas.paste(im=spec.neutral_item_image, box=(canvas_w - item_w, canvas_h - h))
+        return h
+
+    items_h = draw_items_row()
+
+    def draw_abilities_row() -> int:
+        """Draw row representing the order of abilities in skill order of the player."""
+        _w, h = const.Dota.ABILITY_ICON_SIZE
+
+        for count, img in enumerate(spec.ability_icon_images):
+            canvas.paste(img, (count * h, canvas_h - items_h - h))
+        return h
+
+    abilities_h = draw_abilities_row()
+
+    def draw_kda() -> float:
+        """Draw kda.
+
+        Returns height of the segment.
+        """
+        font = TransposeClient.font("./assets/fonts/Inter-Black-slnt=0.ttf", 33)
+        w, h = TransposeClient.get_text_wh(spec.kda, font)
+        draw.text((0, canvas_h - items_h - abilities_h - h), spec.kda, font=font)
+        return h
+
+    kda_h = draw_kda()
+
+    def draw_outcome() -> float:
+        """Draw outcome of the game (Win or Loss).
+
+        Returns height of the segment.
+        """
+        font = TransposeClient.font("./assets/fonts/Inter-Black-slnt=0.ttf", 33)
+        w, h = TransposeClient.get_text_wh(spec.outcome, font)
+        colour_map = {
+            "Win": str(const.MaterialPalette.green(shade=800)),
+            "Loss": str(const.MaterialPalette.red(shade=900)),
+            "Not Scored": (255, 255, 255),
+        }
+        draw.text(
+            xy=(0, canvas_h - items_h - abilities_h - kda_h - h),
+            text=spec.outcome,
+            font=font,
+            fill=colour_map[spec.outcome],
+        )
+        return h
+
+    outcome_h = draw_outcome()
+
+    def draw_talent_tree_choices() -> None:
+        """Draw talent tree choices.
+
+        Mirrors hero's talent tree. Chosen talents are marked with orange colour (otherwise black).
+        Draws mono-colour rectangles on the left/right side of the image.
+        """
+        font = TransposeClient.font("./assets/fonts/Inter-Black-slnt=0.ttf", 15)
+        p = 6
+
+        for count, (talent_name, fill_colour) in enumerate(spec.talents):
+            text_w, text_h = TransposeClient.get_text_wh(talent_name, font)
+
+            x = 0 if count % 2 else canvas_w - text_w
+            position = (x, canvas_h - items_h - abilities_h - kda_h - outcome_h - 20 - 26 * (count // 2))
+            x, y, u, v = draw.textbbox(position, talent_name, font=font)
+
+            draw.rectangle(xy=(x - p, y - p, u + p, v + p), fill=fill_colour)
+            draw.text(xy=position, text=talent_name, font=font, align="right")
+
+    draw_talent_tree_choices()
+
+    def draw_facet() -> None:
+        """Draw facet icon+rectangle. Just a mono-colour rectangle with icon and title text."""
+        icon_p = 1
+        icon_h = const.Dota.FACET_ICON_SIZE[1] + icon_p
+        text_p = 8  # currently just left, right
+        font = TransposeClient.font("./assets/fonts/Inter-Black-slnt=0.ttf", 22)
+
+        # text + rectangle
+        text_w, text_h = TransposeClient.get_text_wh(spec.facet_name, font)
+        x, y, u, v = (
+            canvas_w - text_w - icon_h - 2 * text_p,
+            canvas_h - items_h - abilities_h - icon_h,
+            canvas_w,
+            canvas_h - items_h - abilities_h,
+        )
+        draw.rectangle(xy=(x, y, u, v), fill=spec.facet_colour)
+        draw.text((x + icon_h + text_p, v - (icon_h + text_h) / 2), spec.facet_name, font=font)
+
+        # icon
+        canvas.paste(spec.facet_icon_image, (x + icon_p, y + icon_p), mask=spec.facet_icon_image)
+
+    draw_facet()
+
+    # img.show()
+    return canvas
+
+
 class StratzMatchToEdit(BaseMatchToEdit):
     """Class."""
 
@@ -269,184 +439,79 @@ class StratzMatchToEdit(BaseMatchToEdit):
         return f"<{self.__class__.__name__} {pairs}>"
 
     @override
-    async def edit_notification_image(self, embed_image_url: str, colour: discord.Colour) -> Image.Image:
-        canvas = await self.bot.transposer.url_to_image(embed_image_url)
-        items = [await self.bot.dota.items.by_id(id_) for id_, _ in self.sorted_item_purchases]
-        item_icon_images = [await self.bot.transposer.url_to_cached_image(item.icon_url) for item in items]
+    async def edit_notification_image(
+        self, embed_image_url: str, colour: discord.Colour, filename: str,
+    ) -> EncodedImage:
+        # resolve all storage lookups at once
+        hero = self.hero or await self.bot.dota.heroes.by_id(self.hero_id)
+        facet_id = hero.facet_ids[self.facet_slot]
+        talents, facet = await asyncio.gather(
+            self.bot.dota.abilities.mapping(hero.talent_ids),
+            self.bot.dota.facets.by_id(facet_id),
+        )
+        talents_order = [ability_id for ability_id in self.ability_upgrades_ids if ability_id in hero.talent_ids]
 
-        neutral_item = await self.bot.dota.items.by_id(self.neutral_item_id)
-        neutral_item_image = await self.bot.transposer.url_to_cached_image(neutral_item.icon_url)
+        # and then take the pre-sized icons from the storage tiles at once
+        items, abilities = self.bot.dota.items, self.bot.dota.abilities
+        item_size, ability_size = const.Dota.ITEM_ICON_SIZE, const.Dota.ABILITY_ICON_SIZE
+        canvas, item_icon_images, neutral_item_image, ability_icon_images, facet_icon_image = await asyncio.gather(
+            self.bot.transposer.url_to_image(embed_image_url),
+            asyncio.gather(*(items.icon_tile(id_, item_size) for id_, _ in self.sorted_item_purchases)),
+            items.icon_tile(self.neutral_item_id, item_size),
+            asyncio.gather(*(abilities.icon_tile(id_, ability_size) for id_ in self.ability_upgrades_ids)),
+            self.bot.dota.facets.icon_tile(facet_id, const.Dota.FACET_ICON_SIZE),
+        )
 
-        abilities = [await self.bot.dota.abilities.by_id(id_) for id_ in self.ability_upgrades_ids]
-        ability_icon_images = [await self.bot.transposer.url_to_cached_image(ability.icon_url) for ability in abilities]
+        def talent_fill_colour(talent_id: int) -> str:
+            if talent_id in talents_order[:4]:
+                return "darkorange"
+            if talent_id in talents_order[4:]:
+                return "gray"
+            return "black"
+
+        spec = StratzMatchToEditImageSpec(
+            canvas=canvas,
+            colour=str(colour),
+            item_icon_images=item_icon_images,
+            item_timings=[item_timing for _, item_timing in self.sorted_item_purchases],
+            neutral_item_image=neutral_item_image,
+            ability_icon_images=ability_icon_images,
+            kda=self.kda,
+            outcome=self.outcome,
+            talents=[(talent.display_name, talent_fill_colour(talent_id)) for talent_id, talent in talents.items()],
+            facet_name=facet.display_name,
+            facet_colour=facet.colour,
+            facet_icon_image=facet_icon_image,
+        )
+        return await self.bot.transposer.render(build_stratz_match_to_edit_image, spec, filename=filename)
 
-        hero = self.hero or await self.bot.dota.heroes.by_id(self.hero_id)
-        talents_order = [ability_id for ability_id in self.ability_upgrades_ids if ability_id in hero.talent_ids]
-        talents = {talent_id: await self.bot.dota.abilities.by_id(talent_id) for talent_id in hero.talent_ids}
 
-        facet_id = hero.facet_ids[self.facet_slot]
-        facet = await self.bot.dota.facets.by_id(facet_id)
-        facet_icon_image = await self.bot.transposer.url_to_cached_image(facet.icon_url)
-
-        def build_notification_image() -> Image.Image:
-            edit_log.debug("Building edited notification message.")
-            canvas_w, canvas_h = canvas.size
-            draw = ImageDraw.Draw(canvas)
-
-            def draw_items_row() -> int:
-                """Draw items on a single row.
-
-                Returns height of the row to align other elements in the canvas.
-                """
-                h = 50  # the height for items row, meaning items themselves are of this height.
-                item_w = 69  # then item_w, item_h is (69, 50) which matches 88/64 in proportion (original size).
-                font = ImageFont.truetype("./assets/fonts/Inter-Black-slnt=0.ttf", 19)  # font for item timings
-
-                # rectangle for the row
-                rectangle = Image.new("RGB", (canvas_w, h), str(colour))
-                ImageDraw.Draw(rectangle)
-                canvas.paste(rectangle, (0, canvas_h - h))
-
-                # item images
-                for count, img in enumerate(item_icon_images):
-                    canvas.paste(img.resize((item_w, h)), (count * item_w, canvas_h - h))
-
-                # item timings
-                for count, (item_id, item_timing) in enumerate(self.sorted_item_purchases):
-                    if item_timing:
-                        text_w, text_h = self.bot.transposer.get_text_wh(item_timing, font)
-                        draw.text((count * item_w, canvas_h - text_h), item_timing, font=font, align="left")
-
-                canvas.paste(im=neutral_item_image.resize((item_w, h)), box=(canvas_w - item_w, canvas_h - h))
-                return h
-
-            items_h = draw_items_row()
-
-            def draw_abilities_row() -> int:
-                """Draw row representing the order of abilities in skill order of the player."""
-                h = 37
-
-                for count, img in enumerate(ability_icon_images):
-                    canvas.paste(img.resize((h, h)), (count * h, canvas_h - items_h - h))
-                return h
-
-            abilities_h = draw_abilities_row()
-
-            def draw_kda() -> float:
-                """Draw kda.
-
-                Returns height of the segment.
-                """
-                font = ImageFont.truetype("./assets/fonts/Inter-Black-slnt=0.ttf", 33)
-                w, h = self.bot.transposer.get_text_wh(self.kda, font)
-                draw.text((0, canvas_h - items_h - abilities_h - h), self.kda, font=font)
-                return h
-
-            kda_h = draw_kda()
-
-            def draw_outcome() -> float:
-                """Draw outcome of the game (Win or Loss).
-
-                Returns height of the segment.
-                """
-                font = ImageFont.truetype("./assets/fonts/Inter-Black-slnt=0.ttf", 33)
-                w, h = self.bot.transposer.get_text_wh(self.outcome, font)
-                colour_map = {
-                    "Win": str(const.MaterialPalette.green(shade=800)),
-                    "Loss": str(const.MaterialPalette.red(shade=900)),
-                    "Not Scored": (255, 255, 255),
-                }
-                draw.text(
-                    xy=(0, canvas_h - items_h - abilities_h - kda_h - h),
-                    text=self.outcome,
-                    font=font,
-                    fill=colour_map[self.outcome],
-                )
-                return h
-
-            outcome_h = draw_outcome()
-
-            def draw_talent_tree_choices() -> None:
-                """Draw talent tree choices.
-
-                Mirrors hero's talent tree. Chosen talents are marked with orange colour (otherwise black).
-                Draws mono-colour rectangles on the left/right side of the image.
-                """
-                font = ImageFont.truetype("./assets/fonts/Inter-Black-slnt=0.ttf", 15)
-                p = 6
-
-                for count, (talent_id, talent) in enumerate(talents.items()):
-                    text_w, text_h = self.bot.transposer.get_text_wh(talent.display_name, font)
-
-                    x = 0 if count % 2 else canvas_w - text_w
-                    position = (x, canvas_h - items_h - abilities_h - kda_h - outcome_h - 20 - 26 * (count // 2))
-                    x, y, u, v = draw.textbbox(position, talent.display_name, font=font)
-
-                    if talent_id in talents_order[:4]:
-                        fill_colour = "darkorange"
-                    elif talent_id in talents_order[4:]:
-                        fill_colour = "gray"
-                    else:
-                        fill_colour = "black"
-
-                    draw.rectangle(xy=(x - p, y - p, u + p, v + p), fill=fill_colour)
-                    draw.text(xy=position, text=talent.display_name, font=font, align="right")
-
-            draw_talent_tree_choices()
-
-            def draw_facet() -> None:
-                """Draw facet icon+rectangle. Just a mono-colour rectangle with icon and title text."""
-                icon_h = 40
-                icon_p = 1
-                text_p = 8  # currently just left, right
-                font = ImageFont.truetype("./assets/fonts/Inter-Black-slnt=0.ttf", 22)
-
-                # text + rectangle
-                text_w, text_h = self.bot.transposer.get_text_wh(facet.display_name, font)
-                x, y, u, v = (
-                    canvas_w - text_w - icon_h - 2 * text_p,
-                    canvas_h - items_h - abilities_h - icon_h,
-                    canvas_w,
-                    canvas_h - items_h - abilities_h,
-                )
-                draw.rectangle(xy=(x, y, u, v), fill=facet.colour)
-                draw.text((x + icon_h + text_p, v - (icon_h + text_h) / 2), facet.display_name, font=font)
-
-                # icon
-                resized_facet_image = facet_icon_image.resize((icon_h - icon_p, icon_h - icon_p))
-                canvas.paste(resized_facet_image, (x + icon_p, y + icon_p), mask=resized_facet_image)
-
-            draw_facet()
-
-            # img.show()
-            return canvas
-
-        return await asyncio.to_thread(build_notification_image)
+def build_not_counted_match_to_edit_image(img: Image.Image) -> Image.Image:
+    """Image Builder for `NotCountedMatchToEdit` edited notification."""
+    edit_log.debug("Building edited notification message.")
+    width, height = img.size
+
+    draw = ImageDraw.Draw(img)
+    font = TransposeClient.font("./assets/fonts/Inter-Black-slnt=0.ttf", 45)
+    text = "Not Counted"
+    text_w, text_h = TransposeClient.get_text_wh(text, font)
+    draw.text(
+        xy=(0, height - text_h), text=text, font=font, align="left", fill=str(discord.Colour.dark_orange()),
+    )
+
+    # img.show()
+    return img
 
 
 class NotCountedMatchToEdit(BaseMatchToEdit):
     """Class."""
 
     @override
-    async def edit_notification_image(self, embed_image_url: str, colour: discord.Colour) -> Image.Image:
+    async def edit_notification_image(
+        self, embed_image_url: str, colour: discord.Colour, filename: str,
+    ) -> EncodedImage:
         img = await self.bot.transposer.url_to_image(embed_image_url)
-
-        def build_notification_image() -> Image.Image:
-            edit_log.debug("Building edited notification message.")
-            width, height = img.size
-
-            draw = ImageDraw.Draw(img)
-            font = ImageFont.truetype("./assets/fonts/Inter-Black-slnt=0.ttf", 45)
-            text = "Not Counted"
-            text_w, text_h = self.bot.transposer.get_text_wh(text, font)
-            draw.text(
-                xy=(0, height - text_h), text=text, font=font, align="left", fill=str(discord.Colour.dark_orange()),
-            )
-
-            # img.show()
-            return img
-
-        return await asyncio.to_thread(build_notification_image)
+        return await self.bot.transposer.render(build_not_counted_match_to_edit_image, img, filename=filename)
 
 
 if TYPE_CHECKING:
@@ -471,6 +536,6 @@ async def beta_test_stratz_edit(self: AluCog) -> None:
     data = await self.bot.dota.stratz.get_fpc_match_to_edit(match_id=match_id, friend_id=friend_id)
     match_to_edit = StratzMatchToEdit(self.bot, data)
     new_image = await match_to_edit.edit_notification_image(
-        const.DotaAsset.Placeholder640X360, discord.Colour.purple(),
+        const.DotaAsset.Placeholder640X360, discord.Colour.purple(), "beta-test.png",
     )
-    new_image.show()
+    Image.open(BytesIO(new_image.data)).show()
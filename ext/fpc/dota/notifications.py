@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
 import logging
+import math
 import time
-from typing import TYPE_CHECKING, Any, TypedDict, override
+from typing import TYPE_CHECKING, Any, NamedTuple, TypedDict, override
 
 import aiohttp
 import discord
@@ -20,10 +22,18 @@ if TYPE_CHECKING:
     from steam.ext.dota2 import LiveMatch
 
     from bot import AluBot, AluContext
+    from utils.dota import Hero, PseudoHero
+    from utils.dota.schemas import stratz
 
-    class AnalyzeGetPlayerIDsQueryRow(TypedDict):
+    class SubscriptionsQueryRow(TypedDict):
+        friend_id: int
+        hero_id: int
+        channel_id: int
+        spoil: bool
         twitch_live_only: bool
-        player_ids: list[int]
+        player_id: int
+        display_name: str
+        twitch_id: str | None
 
     class FindMatchesToEditQueryRow(TypedDict):
         match_id: int
@@ -31,15 +41,19 @@ if TYPE_CHECKING:
         hero_id: int
         channel_message_tuples: list[tuple[int, int]]
         player_name: str
+        attempts: int
 
-    class AnalyzeTopSourceResponsePlayerQueryRow(TypedDict):
-        player_id: int
-        display_name: str
-        twitch_id: str
 
-    class GetRecipientsQueryRow(TypedDict):
-        channel_id: int
-        spoil: bool
+class SubscriberTuple(NamedTuple):
+    channel_id: int
+    spoil: bool
+    twitch_live_only: bool
+
+
+class SubscribedPlayerTuple(NamedTuple):
+    player_id: int
+    display_name: str
+    twitch_id: str | None
 
 
 send_log = logging.getLogger("send_dota_fpc")
@@ -70,8 +84,11 @@ class DotaFPCNotifications(BaseNotifications):
         self.game_coordinator_death_counter: int = 0
         self.top_live_matches: list[LiveMatch] = []
 
-        # Edit Matches related attrs
-        self.retry_mapping: dict[tuple[int, int], int] = {}
+        # Subscription index, i.e. `(friend_id, hero_id) -> [subscribers]`
+        self.subscriptions: dict[tuple[int, int], list[SubscriberTuple]] = {}
+        self.subscribed_players: dict[int, SubscribedPlayerTuple] = {}
+        self.subscriptions_updated_at: float = 0.0
+        self.subscriptions_outdated: bool = True
 
     @override
     async def cog_load(self) -> None:
@@ -93,10 +110,59 @@ class DotaFPCNotifications(BaseNotifications):
         self.daily_ratelimit_report.stop()
         return await super().cog_unload()
 
-    async def convert_player_id_to_friend_id(self, player_ids: list[int]) -> list[int]:
-        """Get friend_id by player_id (a serial key in my own database)."""
-        query = "SELECT friend_id FROM dota_accounts WHERE player_id=ANY($1)"
-        return [f for (f,) in await self.bot.pool.fetch(query, player_ids)]
+    @commands.Cog.listener("on_fpc_settings_update")
+    async def mark_subscriptions_outdated(self, prefix: str) -> None:
+        """Mark the subscription index to be rebuilt on the next sender tick."""
+        if prefix == self.prefix:
+            self.subscriptions_outdated = True
+
+    async def update_subscriptions(self) -> None:
+        """Rebuild the subscription index from the FPC settings tables.
+
+        The index is only rebuilt when the settings cogs report a change
+        (or once in a while in case I edit the database by hand)
+        so the sender tick itself doesn't need any per-player database round-trips.
+        """
+        query = """
+            SELECT
+                a.friend_id,
+                c.character_id AS hero_id,
+                s.channel_id,
+                s.spoil,
+                s.twitch_live_only,
+                pl.player_id,
+                pl.display_name,
+                pl.twitch_id
+            FROM dota_favourite_players p
+            JOIN dota_favourite_characters c ON c.guild_id = p.guild_id
+            JOIN dota_settings s ON s.guild_id = p.guild_id
+            JOIN dota_accounts a ON a.player_id = p.player_id
+            JOIN dota_players pl ON pl.player_id = p.player_id
+            WHERE s.enabled = TRUE;
+        """
+        rows: list[SubscriptionsQueryRow] = await self.bot.pool.fetch(query)
+
+        subscriptions: dict[tuple[int, int], list[SubscriberTuple]] = {}
+        subscribed_players: dict[int, SubscribedPlayerTuple] = {}
+        for row in rows:
+            subscriptions.setdefault((row["friend_id"], row["hero_id"]), []).append(
+                SubscriberTuple(
+                    channel_id=row["channel_id"],
+                    spoil=row["spoil"],
+                    twitch_live_only=row["twitch_live_only"],
+                ),
+            )
+            subscribed_players[row["friend_id"]] = SubscribedPlayerTuple(
+                player_id=row["player_id"],
+                display_name=row["display_name"],
+                twitch_id=row["twitch_id"],
+            )
+
+        self.subscriptions = subscriptions
+        self.subscribed_players = subscribed_players
+        self.subscriptions_updated_at = time.monotonic()
+        self.subscriptions_outdated = False
+        send_log.debug("Subscription index is rebuilt with %s (friend_id, hero_id) combos", len(subscriptions))
 
     async def analyze_top_source_response(self, live_matches: list[LiveMatch]) -> None:
         """Analyze FindTopSourceTVGames response from Dota 2 Coordinator and select matches to send notifications for.
@@ -105,87 +171,65 @@ class DotaFPCNotifications(BaseNotifications):
         in matches provided by FindTopSourceTVGames response.
         Also sends the message via MatchToSend class model.
         """
-        query = "SELECT DISTINCT character_id FROM dota_favourite_characters"
-        favourite_hero_ids: list[int] = [r for (r,) in await self.bot.pool.fetch(query)]
+        if self.subscriptions_outdated or time.monotonic() - self.subscriptions_updated_at > 3600:
+            await self.update_subscriptions()
+
+        # need to check what streamers are live for `twitch_live_only` subscribers
+        twitch_live_only_player_ids = list(
+            {
+                self.subscribed_players[friend_id].player_id
+                for (friend_id, _), subscribers in self.subscriptions.items()
+                if any(subscriber.twitch_live_only for subscriber in subscribers)
+            },
+        )
+        live_player_ids: set[int] = set()
+        if twitch_live_only_player_ids:
+            player_streams = await self.get_player_streams(
+                const.Twitch.DOTA_GAME_CATEGORY_ID, twitch_live_only_player_ids,
+            )
+            live_player_ids = set(player_streams.keys())
 
-        query = """
-            SELECT twitch_live_only, ARRAY_AGG(player_id) player_ids
-            FROM dota_favourite_players p
-            JOIN dota_settings s ON s.guild_id = p.guild_id
-            WHERE s.enabled = TRUE
-            GROUP by twitch_live_only
-        """
-        player_id_rows: list[AnalyzeGetPlayerIDsQueryRow] = await self.bot.pool.fetch(query)
-
-        friend_id_cache: dict[bool, list[int]] = {True: [], False: []}
-        for row in player_id_rows:
-            if row["twitch_live_only"]:
-                # need to check what streamers are live
-                twitch_live_player_ids = await self.get_player_streams(
-                    const.Twitch.DOTA_GAME_CATEGORY_ID, row["player_ids"],
-                )
-                friend_id_cache[True] = await self.convert_player_id_to_friend_id(list(twitch_live_player_ids.keys()))
-            else:
-                friend_id_cache[False] = await self.convert_player_id_to_friend_id(row["player_ids"])
+        if self.subscriptions:
+            await self.prefetch_notified_channels([match.id for match in live_matches], key_column="friend_id")
 
         for match in live_matches:
-            for twitch_live_only, friend_ids in friend_id_cache.items():
-                our_players = [p for p in match.players if p.id in friend_ids and p.hero.id in favourite_hero_ids]
-                for player in our_players:
-                    account_id = player.id
-                    hero_id = player.hero.id
-
-                    query = """
-                        SELECT player_id, display_name, twitch_id
-                        FROM dota_players
-                        WHERE player_id=(SELECT player_id FROM dota_accounts WHERE friend_id = $1);
-                    """
-                    user: AnalyzeTopSourceResponsePlayerQueryRow = await self.bot.pool.fetchrow(query, account_id)
-                    query = """
-                        SELECT s.channel_id, s.spoil
-                        FROM dota_favourite_characters c
-                        JOIN dota_favourite_players p on c.guild_id = p.guild_id
-                        JOIN dota_settings s on s.guild_id = c.guild_id
-                        WHERE character_id = $1
-                            AND p.player_id = $2
-                            AND NOT s.channel_id = ANY(
-                                SELECT channel_id
-                                FROM dota_messages
-                                WHERE match_id = $3 AND friend_id = $4
-                            )
-                            AND s.twitch_live_only = $5
-                            AND s.enabled = TRUE;
-                    """
-                    rows: list[GetRecipientsQueryRow] = await self.bot.pool.fetch(
-                        query,
-                        hero_id,
-                        user["player_id"],
-                        match.id,
-                        account_id,
-                        twitch_live_only,
-                    )
+            for player in match.players:
+                subscribers = self.subscriptions.get((player.id, player.hero.id))
+                if not subscribers:
+                    continue
+
+                account_id = player.id
+                hero_id = player.hero.id
+                user = self.subscribed_players[account_id]
+
+                recipients = self.exclude_notified_channels(
+                    match.id,
+                    account_id,
+                    [
+                        RecipientTuple(channel_id=subscriber.channel_id, spoil=subscriber.spoil)
+                        for subscriber in subscribers
+                        if not subscriber.twitch_live_only or user.player_id in live_player_ids
+                    ],
+                )
 
-                    if rows:
-                        player_hero = await self.bot.dota.heroes.by_id(hero_id)
-                        send_log.debug("%s - %s", user["display_name"], player_hero.display_name)
-                        match_to_send = MatchToSend(
-                            self.bot,
-                            match_id=match.id,
-                            friend_id=account_id,
-                            start_time=match.start_time,
-                            player_name=user["display_name"],
-                            player_hero=player_hero,
-                            twitch_id=user["twitch_id"],
-                            hero_ids=[hero.id for hero in match.heroes],
-                            server_steam_id=match.server_steam_id,
-                        )
-                        # SENDING
-                        start_time = time.perf_counter()
-                        await self.send_match(
-                            match_to_send,
-                            [RecipientTuple(channel_id=row["channel_id"], spoil=row["spoil"]) for row in rows],
-                        )
-                        send_log.debug("Sending took %.5f secs", time.perf_counter() - start_time)
+                if recipients:
+                    player_hero = await self.bot.dota.heroes.by_id(hero_id)
+                    send_log.debug("%s - %s", user.display_name, player_hero.display_name)
+                    match_to_send = MatchToSend(
+                        self.bot,
+                        match_id=match.id,
+                        friend_id=account_id,
+                        start_time=match.start_time,
+                        player_name=user.display_name,
+                        player_hero=player_hero,
+                        twitch_id=user.twitch_id,
+                        hero_ids=[hero.id for hero in match.heroes],
+                        server_steam_id=match.server_steam_id,
+                    )
+                    # SENDING
+                    start_time = time.perf_counter()
+                    await self.send_match(match_to_send, recipients)
+                    send_log.debug("Sending took %.5f secs", time.perf_counter() - start_time)
 
     @aluloop(seconds=59)
     async def notification_sender(self) -> None:
@@ -223,14 +267,15 @@ class DotaFPCNotifications(BaseNotifications):
 
         send_log.debug("--- Task is finished ---")
 
-    @aluloop(minutes=5)
+    @aluloop(minutes=1)
     async def notification_editor(self) -> None:
         """Task responsible for editing Dota FPC Messages with PostMatch Result data.
 
         The data is featured from Opendota/Stratz.
+        The edit queue lives in `dota_messages` table: every tick only picks up the matches
+        whose `next_attempt_at` is due, failed attempts are rescheduled with exponential backoff.
         """
         if not self.top_live_matches:
-            # remember that bcs of this the very first edit actually happens 10 minutes after the reboot.
             return
 
         edit_log.debug("*** Starting Task to Edit Dota FPC Messages ***")
@@ -241,104 +286,198 @@ class DotaFPCNotifications(BaseNotifications):
                 friend_id,
                 hero_id,
                 player_name,
+                MAX(attempts) attempts,
                 ARRAY_AGG ((channel_id, message_id)) channel_message_tuples
             FROM dota_messages
-            WHERE NOT match_id=ANY($1)
+            WHERE next_attempt_at <= NOW() AND NOT match_id=ANY($1)
             GROUP BY match_id, friend_id, hero_id, player_name
         """
         match_rows: list[FindMatchesToEditQueryRow] = await self.bot.pool.fetch(
             query, [match.id for match in self.top_live_matches],
         )
 
-        for match_row in match_rows:
-            # note to the following line: we could make retry database column instead of
-            # having local self.retry_mapping but idk.
-            tuple_uuid = match_id, friend_id = match_row["match_id"], match_row["friend_id"]
-            if tuple_uuid not in self.retry_mapping:
-                self.retry_mapping[tuple_uuid] = 0
-                # Stratz 99% will not have data in the first 5 minutes so it's just a wasted call
-                # Thus lets skip the very first loop #0
-                continue
-            self.retry_mapping[tuple_uuid] += 1
-
-            player_hero = await self.bot.dota.heroes.by_id(match_row["hero_id"])
-            # discord-markdown friendly strings for my #logger channel.
-            # put it into the beginning of every consequent edit_log.info / edit_log.debug call
-            log_str = (
-                f"`r={self.retry_mapping[tuple_uuid]}` "
-                f"[`{match_id}`](<https://stratz.com/matches/{match_id}>) "
-                f"[`{match_row['player_name']}`](<https://stratz.com/players/{friend_id}>) "
-                f"{player_hero.emote}"
-            )
+        # the matches go through "Stratz request -> render image -> edit messages" pipeline concurrently
+        # but the amount of simultaneous Stratz requests shrinks when the daily budget is running low.
+        # Stratz requests are batched: up to `batch_size` matches per one GraphQL query.
+        semaphore = asyncio.Semaphore(self.get_stratz_concurrency())
+        batch_size = 10
+        await asyncio.gather(
+            *(
+                self.process_batch_to_edit(match_rows[i : i + batch_size], semaphore)
+                for i in range(0, len(match_rows), batch_size)
+            ),
+        )
+        edit_log.debug("*** Finished Task to Edit Dota FPC Messages ***")
 
-            edit_log.debug("%s Start editing attempt.", log_str)
-            if self.retry_mapping[tuple_uuid] > 9:
-                edit_log.info("%s It's been too long - giving up on editing.", log_str)
-                await self.delete_match_from_editing_queue(match_id, friend_id)
-                # TODO: maybe edit the match with opendota instead? to have at least some data
-
-            try:
-                stratz_data = await self.bot.dota.stratz.get_fpc_match_to_edit(match_id=match_id, friend_id=friend_id)
-            except aiohttp.ClientResponseError as exc:
-                edit_log.warning("%s Stratz API Resp: Not OK, Status `%s` \N{CROSS MARK}", log_str, exc.status)
-                continue
-
-            if not stratz_data["data"]["match"]:
-                edit_log.warning("%s GetMatchDetails does not work \N{CROSS MARK}", log_str)
-                continue  # idk fuck my life, GetMatchDetails does not work.
-                # # This is None when conditions under "*" below happen
-                # # which we have to separate
-                # try:
-                #     match_details = await self.bot.dota.steam_web_api.get_match_details(match_id)
-                # except aiohttp.ClientResponseError as exc:
-                #     edit_log.warning("SteamWebAPI: it's down? status `%s`", exc.status)  # exc_info = true
-                #     # we can't confirm if any of "*" conditions are true
-                #     # so we will have to rely on other elif/else in future loops
-                #     continue
-
-                # try:
-                #     duration = match_details["result"]["duration"]
-                # except KeyError:
-                #     edit_log.warning("%s SteamWebAPI: KeyError - match is not ready (still live?).", log_str)
-                #     edit_log.warning("%s", match_details)
-                #     continue
-
-                # if duration < 900:  # 15 minutes (stratz excluded some 11 minutes games too)
-                #     # * Game did not count
-                #     # * Game was less than 10 minutes
-                #     edit_log.info("%s SteamWebAPI: match did not count. Deleting the match.", log_str)
-                #     match_to_edit = NotCountedMatchToEdit(self.bot)
-                # else:
-                #     # * Game is still live
-                #     # * Steam Web API / Dota 2 Game Coordinator is dying
-                #     edit_log.warning("%s SteamWebAPI: match is not ready (still live or GC dying).", log_str)
-                #     continue
-
-            if not stratz_data["data"]["match"]["statsDateTime"]:
-                edit_log.warning("%s Parsing was not finished \N{CROSS MARK}", log_str)
-                continue
-            match_to_edit = StratzMatchToEdit(self.bot, stratz_data, player_hero)
-
-            # now we know how exactly to edit the match with a specific `match_to_edit`
-            await self.edit_match(
-                match_to_edit,
-                [
-                    EditTuple(channel_id=channel_id, message_id=message_id)
-                    for channel_id, message_id in match_row["channel_message_tuples"]
-                ],
+    def get_stratz_concurrency(self, max_concurrency: int = 8) -> int:
+        """Get amount of Stratz requests we allow to run at the same time.
+
+        Scales down with `rate_limits_ratio` (remaining/limit for the day) so a big tournament day
+        doesn't burn through the daily budget in one go.
+        """
+        ratio = self.bot.dota.stratz.rate_limiter.rate_limits_ratio
+        return max(1, math.ceil(max_concurrency * ratio))
+
+    async def process_batch_to_edit(
+        self, match_rows: list[FindMatchesToEditQueryRow], semaphore: asyncio.Semaphore,
+    ) -> None:
+        """Request Stratz data for a batch of matches in one go and then do editing attempts for each of them."""
+        pairs = [(match_row["match_id"], match_row["friend_id"]) for match_row in match_rows]
+        try:
+            async with semaphore:
+                stratz_responses = await self.bot.dota.stratz.get_fpc_matches_to_edit(pairs)
+        except aiohttp.ClientResponseError as exc:
+            edit_log.warning(
+                "Stratz API Resp: Not OK, Status `%s` \N{CROSS MARK} for batch (match_id, friend_id): %s",
+                exc.status,
+                pairs,
             )
+            stratz_responses = {}
+
+        results = await asyncio.gather(
+            *(
+                self.process_match_to_edit(match_row, stratz_responses.get(pair))
+                for match_row, pair in zip(match_rows, pairs, strict=True)
+            ),
+            return_exceptions=True,
+        )
+        for match_row, result in zip(match_rows, results, strict=True):
+            if isinstance(result, Exception):
+                match_id, friend_id = match_row["match_id"], match_row["friend_id"]
+                embed = discord.Embed(
+                    colour=0xEF7A85,
+                    description=f"Failed to edit FPC notification for match_id=`{match_id}`, friend_id=`{friend_id}`.",
+                ).set_footer(text=f"{self.__class__.__name__}.notification_editor")
+                await self.bot.exc_manager.register_error(result, embed)
+                attempt = match_row["attempts"] + 1
+                log_str = f"`r={attempt}` [`{match_id}`](<https://stratz.com/matches/{match_id}>)"
+                await self.reschedule_match_editing(match_id, friend_id, attempt, log_str)
+            elif isinstance(result, BaseException):
+                raise result
+
+    async def process_match_to_edit(
+        self, match_row: FindMatchesToEditQueryRow, stratz_data: stratz.FPCMatchesResponse | None,
+    ) -> None:
+        """Do one editing attempt for the match and update the edit queue accordingly."""
+        match_id, friend_id = match_row["match_id"], match_row["friend_id"]
+        attempt = match_row["attempts"] + 1
+
+        player_hero = await self.bot.dota.heroes.by_id(match_row["hero_id"])
+        # discord-markdown friendly strings for my #logger channel.
+        # put it into the beginning of every consequent edit_log.info / edit_log.debug call
+        log_str = (
+            f"`r={attempt}` "
+            f"[`{match_id}`](<https://stratz.com/matches/{match_id}>) "
+            f"[`{match_row['player_name']}`](<https://stratz.com/players/{friend_id}>) "
+            f"{player_hero.emote}"
+        )
+
+        edit_log.debug("%s Start editing attempt.", log_str)
+        try:
+            edited = await self.try_editing_match(match_row, player_hero, log_str, stratz_data)
+        except discord.NotFound:
+            # the notification message (or the webhook) is deleted - retrying won't bring it back
+            edit_log.info("%s Notification message is not found - giving up on editing.", log_str)
+            await self.delete_match_from_editing_queue(match_id, friend_id)
+            return
+
+        if edited:
             edit_log.info("%s Edited message \N{WHITE HEAVY CHECK MARK}", log_str)
             await self.delete_match_from_editing_queue(match_id, friend_id)
-        edit_log.debug("*** Finished Task to Edit Dota FPC Messages ***")
+        else:
+            await self.reschedule_match_editing(match_id, friend_id, attempt, log_str)
+
+    async def try_editing_match(
+        self,
+        match_row: FindMatchesToEditQueryRow,
+        player_hero: Hero | PseudoHero,
+        log_str: str,
+        stratz_data: stratz.FPCMatchesResponse | None,
+    ) -> bool:
+        """Try to edit the match notification messages with Stratz data.
+
+        Returns
+        -------
+        bool
+            Whether the messages were edited, `False` means we need to try again later.
+
+        """
+        if stratz_data is None:
+            edit_log.warning("%s Stratz API Resp: Not OK \N{CROSS MARK}", log_str)
+            return False
+
+        if not stratz_data["data"]["match"]:
+            edit_log.warning("%s GetMatchDetails does not work \N{CROSS MARK}", log_str)
+            return False  # idk fuck my life, GetMatchDetails does not work.
+            # # This is None when conditions under "*" below happen
+            # # which we have to separate
+            # try:
+            #     match_details = await self.bot.dota.steam_web_api.get_match_details(match_id)
+            # except aiohttp.ClientResponseError as exc:
+            #     edit_log.warning("SteamWebAPI: it's down? status `%s`", exc.status)  # exc_info = true
+            #     # we can't confirm if any of "*" conditions are true
+            #     # so we will have to rely on other elif/else in future loops
+            #     continue
+
+            # try:
+            #     duration = match_details["result"]["duration"]
+            # except KeyError:
+            #     edit_log.warning("%s SteamWebAPI: KeyError - match is not ready (still live?).", log_str)
+            #     edit_log.warning("%s", match_details)
+            #     continue
+
+            # if duration < 900:  # 15 minutes (stratz excluded some 11 minutes games too)
+            #     # * Game did not count
+            #     # * Game was less than 10 minutes
+            #     edit_log.info("%s SteamWebAPI: match did not count. Deleting the match.", log_str)
+            #     match_to_edit = NotCountedMatchToEdit(self.bot)
+            # else:
+            #     # * Game is still live
+            #     # * Steam Web API / Dota 2 Game Coordinator is dying
+            #     edit_log.warning("%s SteamWebAPI: match is not ready (still live or GC dying).", log_str)
+            #     continue
+
+        if not stratz_data["data"]["match"]["statsDateTime"]:
+            edit_log.warning("%s Parsing was not finished \N{CROSS MARK}", log_str)
+            return False
+        match_to_edit = StratzMatchToEdit(self.bot, stratz_data, player_hero)
+
+        # now we know how exactly to edit the match with a specific `match_to_edit`
+        await self.edit_match(
+            match_to_edit,
+            [
+                EditTuple(channel_id=channel_id, message_id=message_id)
+                for channel_id, message_id in match_row["channel_message_tuples"]
+            ],
+        )
+        return True
+
+    async def reschedule_match_editing(self, match_id: int, friend_id: int, attempts: int, log_str: str) -> None:
+        """Persist the failed attempt and schedule the next one with exponential backoff (capped at 1 hour).
+
+        Gives up on editing the match after 7 failed attempts.
+        """
+        if attempts >= 7:
+            # 5 + 5 + 10 + 20 + 40 + 60 + 60 minutes, so about 3 hours after the first notification.
+            edit_log.info("%s It's been too long - giving up on editing.", log_str)
+            await self.delete_match_from_editing_queue(match_id, friend_id)
+            # TODO: maybe edit the match with opendota instead? to have at least some data
+            return
+
+        query = """
+            UPDATE dota_messages
+            SET attempts = $3, next_attempt_at = NOW() + make_interval(mins => LEAST(5 * 2 ^ ($3 - 1), 60)::int)
+            WHERE match_id=$1 AND friend_id=$2
+        """
+        await self.bot.pool.execute(query, match_id, friend_id, attempts)
 
     async def delete_match_from_editing_queue(self, match_id: int, friend_id: int) -> None:
-        """Delete the match to edit from database and retry_mapping.
+        """Delete the match to edit from the database.
 
         Meaning the editing is either finished or given up on.
         """
         query = "DELETE FROM dota_messages WHERE match_id=$1 AND friend_id=$2"
         await self.bot.pool.execute(query, match_id, friend_id)
-        self.retry_mapping.pop((match_id, friend_id), None)
 
     # STRATZ RATE LIMITS
 
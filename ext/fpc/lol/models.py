@@ -4,13 +4,15 @@ import asyncio
 import datetime
 import logging
 import re
-from typing import TYPE_CHECKING, override
+from io import BytesIO
+from typing import TYPE_CHECKING, NamedTuple, override
 
 import discord
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 
 from utils import const, lol
 from utils.formats import human_timedelta
+from utils.transposer import TransposeClient
 
 from ..base_classes import BaseMatchToEdit, BaseMatchToSend
 
@@ -19,8 +21,9 @@ if TYPE_CHECKING:
 
     from bot import AluBot
     from utils.lol import Champion, PseudoChampion
+    from utils.transposer import EncodedImage
 
-    from ..base_classes import RecipientKwargs
+    from ..base_classes import EditTuple, RecipientKwargs
     from .notifications import LivePlayerAccountRow
 
 
@@ -41,6 +44,55 @@ def lol_links(platform: lol.LiteralPlatform, game_name: str, tag_line: str) -> s
     return f"/[Opgg]({opgg})/[Ugg]({ugg})"
 
 
+class MatchToSendImageSpec(NamedTuple):
+    """Render spec for `build_match_to_send_image`."""
+
+    img: Image.Image
+    champion_icon_images: list[Image.Image]
+    rune_icon_images: list[Image.Image]
+    summoner_icon_images: list[Image.Image]
+    text: str
+
+
+def build_match_to_send_image(spec: MatchToSendImageSpec) -> Image.Image:
+    """Image Builder for `MatchToSend` notification."""
+    img = spec.img
+    width, height = img.size
+    information_row = 50
+    rectangle = Image.new("RGB", (width, 100), f"#{const.Colour.darkslategray:0>6x}")
+    ImageDraw.Draw(rectangle)
+    img.paste(rectangle)
+    img.paste(rectangle, (0, height - information_row))
+
+    # champion icons
+    for count, champion_image in enumerate(spec.champion_icon_images):
+        champion_image = champion_image.resize((62, 62))  # noqa: PLW2901
+        extra_space = 0 if count < 5 else 20
+        img.paste(champion_image, (count * 62 + extra_space, 0))
+
+    # middle text "Streamer - Champion"
+    font = TransposeClient.font("./assets/fonts/Inter-Black-slnt=0.ttf", 33)
+    draw = ImageDraw.Draw(img)
+    w2, _ = TransposeClient.get_text_wh(spec.text, font)  # _ is `h2`
+    draw.text(xy=((width - w2) / 2, 65), text=spec.text, font=font, align="center")
+
+    # rune icons
+    left = 0
+    for count, rune_image in enumerate(spec.rune_icon_images):
+        if count < 6:
+            # actual runes (as in non-stat modifiers)
+            rune_image = rune_image.resize((information_row, information_row))  # noqa: PLW2901
+        img.paste(rune_image, (left, height - rune_image.height), rune_image)
+        left += rune_image.width
+
+    # summoner spell icons
+    left = width - 2 * information_row
+    for count, spell_image in enumerate(spec.summoner_icon_images):
+        spell_image = spell_image.resize((information_row, information_row))  # noqa: PLW2901
+        img.paste(spell_image, (left + count * spell_image.width, height - spell_image.height))
+    return img
+
+
 class MatchToSend(BaseMatchToSend):
     def __init__(
         self,
@@ -85,67 +137,44 @@ class MatchToSend(BaseMatchToSend):
         return int(datetime.datetime.now(datetime.UTC).timestamp() - timestamp_seconds)
 
     @override
-    async def notification_image(self, stream_preview_url: str, display_name: str) -> Image.Image:
+    async def notification_image(self, stream_preview_url: str, display_name: str, filename: str) -> EncodedImage:
         # prepare stuff for the following PIL procedures
-        img = await self.bot.transposer.url_to_image(stream_preview_url)
-
+        # resolve all storage lookups at once
         sorted_champion_ids = await self.bot.lol.roles.sort_champions_by_roles(self.all_champion_ids)
-        champion_icon_urls = [(await self.bot.lol.champions.by_id(id_)).icon_url for id_ in sorted_champion_ids]
-        champion_icon_images = [await self.bot.transposer.url_to_image(url) for url in champion_icon_urls]
-
-        rune_icon_urls = [await self.bot.lol.rune_icons.by_id(id_) for id_ in self.rune_ids]
-        rune_icon_images = [await self.bot.transposer.url_to_image(url) for url in rune_icon_urls]
-
-        summoner_icon_urls = [await self.bot.lol.summoner_spell_icons.by_id(id_) for id_ in self.summoner_spell_ids]
-        summoner_icon_images = [await self.bot.transposer.url_to_image(url) for url in summoner_icon_urls]
-
-        def build_notification_image() -> Image.Image:
-            width, height = img.size
-            information_row = 50
-            rectangle = Image.new("RGB", (width, 100), f"#{const.Colour.darkslategray:0>6x}")
-            ImageDraw.Draw(rectangle)
-            img.paste(rectangle)
-            img.paste(rectangle, (0, height - information_row))
-
-            # champion icons
-            for count, champion_image in enumerate(champion_icon_images):
-                champion_image = champion_image.resize((62, 62))  # noqa: PLW2901
-                extra_space = 0 if count < 5 else 20
-                img.paste(champion_image, (count * 62 + extra_space, 0))
-
-            # middle text "Streamer - Champion"
-            font = ImageFont.truetype("./assets/fonts/Inter-Black-slnt=0.ttf", 33)
-            draw = ImageDraw.Draw(img)
-            text = f"{display_name} - {self.champion.display_name}"
-            w2, _ = self.bot.transposer.get_text_wh(text, font)  # _ is `h2`
-            draw.text(xy=((width - w2) / 2, 65), text=text, font=font, align="center")
-
-            # rune icons
-            left = 0
-            for count, rune_image in enumerate(rune_icon_images):
-                if count < 6:
-                    # actual runes (as in non-stat modifiers)
-                    rune_image = rune_image.resize((information_row, information_row))  # noqa: PLW2901
-                img.paste(rune_image, (left, height - rune_image.height), rune_image)
-                left += rune_image.width
-
-            # summoner spell icons
-            left = width - 2 * information_row
-            for count, spell_image in enumerate(summoner_icon_images):
-                spell_image = spell_image.resize((information_row, information_row))  # noqa: PLW2901
-                img.paste(spell_image, (left + count * spell_image.width, height - spell_image.height))
-            return img
-
-        return await asyncio.to_thread(build_notification_image)
+        champions, rune_icon_urls, summoner_icon_urls = await asyncio.gather(
+            self.bot.lol.champions.by_ids(sorted_champion_ids),
+            self.bot.lol.rune_icons.by_ids(self.rune_ids),
+            self.bot.lol.summoner_spell_icons.by_ids(self.summoner_spell_ids),
+        )
+        champion_icon_urls = [champion.icon_url for champion in champions]
+
+        # and then download all the images at once
+        img, icons = await asyncio.gather(
+            self.bot.transposer.url_to_image(stream_preview_url),
+            self.bot.transposer.urls_to_images(
+                [*champion_icon_urls, *rune_icon_urls, *summoner_icon_urls], cached=True,
+            ),
+        )
+        champion_icon_images = [icons[url] for url in champion_icon_urls]
+        rune_icon_images = [icons[url] for url in rune_icon_urls]
+        summoner_icon_images = [icons[url] for url in summoner_icon_urls]
+
+        spec = MatchToSendImageSpec(
+            img=img,
+            champion_icon_images=champion_icon_images,
+            rune_icon_images=rune_icon_images,
+            summoner_icon_images=summoner_icon_images,
+            text=f"{display_name} - {self.champion.display_name}",
+        )
+        return await self.bot.transposer.render(build_match_to_send_image, spec, filename=filename)
 
     @override
-    async def webhook_send_kwargs(self) -> RecipientKwargs:
+    async def webhook_send_kwargs(self) -> tuple[EncodedImage, RecipientKwargs]:
         streamer = await self.bot.twitch.fetch_streamer(self.twitch_id)
 
-        notification_image = await self.notification_image(streamer.preview_url, streamer.display_name)
         title = f"{streamer.display_name} - {self.champion.display_name}"
         filename = re.sub(r"[_' ]", "", title) + ".png"
-        image_file = self.bot.transposer.image_to_file(notification_image, filename=filename)
+        image = await self.notification_image(streamer.preview_url, streamer.display_name, filename)
         embed = (
             discord.Embed(
                 color=const.Colour.darkslategray,
@@ -159,29 +188,121 @@ class MatchToSend(BaseMatchToSend):
             )
             .set_author(name=title, url=streamer.url, icon_url=streamer.avatar_url)
             .set_thumbnail(url=self.champion.icon_url)
-            .set_image(url=f"attachment://{image_file.filename}")
+            .set_image(url=f"attachment://{image.filename}")
         )
 
-        return {
+        return image, {
             "embed": embed,
-            "file": image_file,
             "username": title,
             "avatar_url": self.champion.icon_url,
         }
 
     @override
-    async def insert_into_game_messages(self, message_id: int, channel_id: int) -> None:
+    async def insert_into_game_messages(self, messages: list[EditTuple]) -> None:
         query = """
             INSERT INTO lol_messages
             (message_id, channel_id, match_id, platform, champion_id)
             VALUES ($1, $2, $3, $4, $5)
         """
-        await self.bot.pool.execute(query, message_id, channel_id, self.match_id, self.platform, self.champion.id)
+        await self.bot.pool.executemany(
+            query,
+            [(m.message_id, m.channel_id, self.match_id, self.platform, self.champion.id) for m in messages],
+        )
 
         query = "UPDATE lol_accounts SET last_edited=$1 WHERE summoner_id=$2"
         await self.bot.pool.execute(query, self.match_id, self.summoner_id)
 
 
+class MatchToEditImageSpec(NamedTuple):
+    """Render spec for `build_match_to_edit_image`."""
+
+    img: Image.Image
+    item_icon_images: list[Image.Image]
+    trinket_icon_img: Image.Image
+    skill_build: list[int]
+    kda: str
+    outcome: str
+
+
+def build_match_to_edit_image(spec: MatchToEditImageSpec) -> Image.Image:
+    """Image Builder for `MatchToEdit` edited notification."""
+    img = spec.img
+    width, height = img.size
+    information_row = 50  # hard coded bcs of knowing code of MatchToSend
+    font = TransposeClient.font("./assets/fonts/Inter-Black-slnt=0.ttf", 34)
+    draw = ImageDraw.Draw(img)
+
+    # Item Icons
+    items_row = information_row
+    for count, item_image in enumerate(spec.item_icon_images):
+        left = count * items_row
+        item_image = item_image.resize((items_row, items_row))
+        img.paste(
+            im=item_image,
+            box=(left, height - information_row - item_image.height),
+        )
+
+    # Trinket Icon
+    trinket_image = spec.trinket_icon_img.resize((items_row, items_row))
+    img.paste(
+        im=trinket_image,
+        box=(width - trinket_image.width, height - information_row - trinket_image.height),
+    )
+
+    # Skill Build
+    # I got these images by downloading .png from
+    # https://commons.wikimedia.org/wiki/Category:Emoji_One_BW
+    # and using Paint Bucket Tool to give it proper colours
+    # plus resized to 50x50 afterwards
+    skill_slot_mapping = {
+        1: "assets/images/local/Q.png",
+        2: "assets/images/local/W.png",
+        3: "assets/images/local/E.png",
+        4: "assets/images/local/R.png",
+    }
+    skill_order_row = 40
+    skill_slot_images = {
+        skill_slot: Image.open(path).resize((skill_order_row, skill_order_row))
+        for skill_slot, path in skill_slot_mapping.items()
+    }
+
+    for count, skill_slot in enumerate(reversed(spec.skill_build)):
+        skill_slot_image = skill_slot_images[skill_slot]
+        img.paste(
+            im=skill_slot_image,
+            box=(
+                count * skill_slot_image.width,
+                height - information_row - items_row - skill_slot_image.height,
+            ),
+        )
+
+    # KDA Text
+    kda_text_w, kda_text_h = TransposeClient.get_text_wh(spec.kda, font)
+    draw.text(
+        (0, height - information_row - items_row - skill_order_row - kda_text_h),
+        spec.kda,
+        font=font,
+        align="right",
+    )
+
+    # Outcome Text
+    outcome_text_w, outcome_text_h = TransposeClient.get_text_wh(spec.outcome, font)
+    colour_dict = {
+        "Win": str(const.MaterialPalette.green(shade=800)),
+        "Loss": str(const.MaterialPalette.red(shade=900)),
+        "No Scored": (255, 255, 255),
+    }
+    draw.text(
+        xy=(0, height - information_row - items_row - skill_order_row - kda_text_h - outcome_text_h - 5),
+        text=spec.outcome,
+        font=font,
+        align="center",
+        fill=colour_dict[spec.outcome],
+    )
+
+    return img
+
+
 class MatchToEdit(BaseMatchToEdit):
     def __init__(
         self,
@@ -225,91 +346,29 @@ class MatchToEdit(BaseMatchToEdit):
                         continue
 
     @override
-    async def edit_notification_image(self, embed_image_url: str, _colour: discord.Colour) -> Image.Image:
-        img = await self.bot.transposer.url_to_image(embed_image_url)
-        item_icon_urls = [await self.bot.lol.item_icons.by_id(id_) for id_ in reversed(self.sorted_item_ids) if id]
-        item_icon_images = [await self.bot.transposer.url_to_image(url) for url in item_icon_urls]
-
-        trinket_icon_url = await self.bot.lol.item_icons.by_id(self.trinket_item_id)
-        trinket_icon_img = await self.bot.transposer.url_to_image(trinket_icon_url)
-
-        def build_notification_image() -> Image.Image:
-            width, height = img.size
-            information_row = 50  # hard coded bcs of knowing code of MatchToSend
-            font = ImageFont.truetype("./assets/fonts/Inter-Black-slnt=0.ttf", 34)
-            draw = ImageDraw.Draw(img)
-
-            # Item Icons
-            items_row = information_row
-            for count, item_image in enumerate(item_icon_images):
-                left = count * items_row
-                item_image = item_image.resize((items_row, items_row))
-                img.paste(
-                    im=item_image,
-                    box=(left, height - information_row - item_image.height),
-                )
-
-            # Trinket Icon
-            trinket_image = trinket_icon_img.resize((items_row, items_row))
-            img.paste(
-                im=trinket_image,
-                box=(width - trinket_image.width, height - information_row - trinket_image.height),
-            )
-
-            # Skill Build
-            # I got these images by downloading .png from
-            # https://commons.wikimedia.org/wiki/Category:Emoji_One_BW
-            # and using Paint Bucket Tool to give it proper colours
-            # plus resized to 50x50 afterwards
-            skill_slot_mapping = {
-                1: "assets/images/local/Q.png",
-                2: "assets/images/local/W.png",
-                3: "assets/images/local/E.png",
-                4: "assets/images/local/R.png",
-            }
-            skill_order_row = 40
-            skill_slot_images = {
-                skill_slot: Image.open(path).resize((skill_order_row, skill_order_row))
-                for skill_slot, path in skill_slot_mapping.items()
-            }
-
-            for count, skill_slot in enumerate(reversed(self.skill_build)):
-                skill_slot_image = skill_slot_images[skill_slot]
-                img.paste(
-                    im=skill_slot_image,
-                    box=(
-                        count * skill_slot_image.width,
-                        height - information_row - items_row - skill_slot_image.height,
-                    ),
-                )
-
-            # KDA Text
-            kda_text_w, kda_text_h = self.bot.transposer.get_text_wh(self.kda, font)
-            draw.text(
-                (0, height - information_row - items_row - skill_order_row - kda_text_h),
-                self.kda,
-                font=font,
-                align="right",
-            )
-
-            # Outcome Text
-            outcome_text_w, outcome_text_h = self.bot.transposer.get_text_wh(self.outcome, font)
-            colour_dict = {
-                "Win": str(const.MaterialPalette.green(shade=800)),
-                "Loss": str(const.MaterialPalette.red(shade=900)),
-                "No Scored": (255, 255, 255),
-            }
-            draw.text(
-                xy=(0, height - information_row - items_row - skill_order_row - kda_text_h - outcome_text_h - 5),
-                text=self.outcome,
-                font=font,
-                align="center",
-                fill=colour_dict[self.outcome],
-            )
-
-            return img
-
-        return await asyncio.to_thread(build_notification_image)
+    async def edit_notification_image(
+        self, embed_image_url: str, _colour: discord.Colour, filename: str,
+    ) -> EncodedImage:
+        item_icon_urls, trinket_icon_url = await asyncio.gather(
+            self.bot.lol.item_icons.by_ids(id_ for id_ in reversed(self.sorted_item_ids) if id),
+            self.bot.lol.item_icons.by_id(self.trinket_item_id),
+        )
+        img, icons = await asyncio.gather(
+            self.bot.transposer.url_to_image(embed_image_url),
+            self.bot.transposer.urls_to_images([*item_icon_urls, trinket_icon_url], cached=True),
+        )
+        item_icon_images = [icons[url] for url in item_icon_urls]
+        trinket_icon_img = icons[trinket_icon_url]
+
+        spec = MatchToEditImageSpec(
+            img=img,
+            item_icon_images=item_icon_images,
+            trinket_icon_img=trinket_icon_img,
+            skill_build=self.skill_build,
+            kda=self.kda,
+            outcome=self.outcome,
+        )
+        return await self.bot.transposer.render(build_match_to_edit_image, spec, filename=filename)
 
 
 if TYPE_CHECKING:
@@ -342,6 +401,6 @@ async def beta_test_edit_image(self: AluCog) -> None:
     )
 
     new_image = await post_match_player.edit_notification_image(
-        const.DotaAsset.Placeholder640X360, discord.Colour.purple()
+        const.DotaAsset.Placeholder640X360, discord.Colour.purple(), "beta-test.png",
     )
-    new_image.show()
+    Image.open(BytesIO(new_image.data)).show()
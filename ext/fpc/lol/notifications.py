@@ -13,6 +13,8 @@ from ..base_classes import BaseNotifications, EditTuple, RecipientTuple
 from .models import MatchToEdit, MatchToSend
 
 if TYPE_CHECKING:
+    from pulsefire.schemas import RiotAPISchema
+
     from bot import AluBot
 
     class LivePlayerAccountRow(TypedDict):
@@ -78,6 +80,13 @@ class Notifications(BaseNotifications):
         # todo: bring pulsefire TaskGroup here
         # I'm not sure how to combine `player_account_rows` with results from Semaphore though.
         # https://pulsefire.iann838.com/usage/advanced/concurrent-requests/
+        candidates: list[
+            tuple[
+                LivePlayerAccountRow,
+                RiotAPISchema.LolSpectatorV5Game,
+                RiotAPISchema.LolSpectatorV5GameParticipant,
+            ]
+        ] = []
         for player_account_row in player_account_rows:
             try:
                 game = await self.bot.lol.get_lol_spectator_v5_active_game_by_summoner(
@@ -118,31 +127,39 @@ class Notifications(BaseNotifications):
                 and participant["championId"] in favourite_champion_ids
                 and player_account_row["last_edited"] != game["gameId"]
             ):
-                query = """
-                    SELECT s.channel_id, s.spoil
-                    FROM lol_favourite_characters c
-                    JOIN lol_favourite_players p on c.guild_id = p.guild_id
-                    JOIN lol_settings s on s.guild_id = c.guild_id
-                    WHERE character_id=$1
-                        AND player_id=$2
-                        AND NOT channel_id=ANY(SELECT channel_id FROM lol_messages WHERE match_id=$3)
-                        AND s.enabled = TRUE;
-                """
-                rows: list[GetRecipientsQueryRow] = await self.bot.pool.fetch(
-                    query,
-                    participant["championId"],
-                    player_account_row["player_id"],
-                    game["gameId"],
-                )
-
-                if rows:
-                    champion = await self.bot.lol.champions.by_id(participant["championId"])
-                    log.debug("Notif %s - %s", player_account_row["display_name"], champion.display_name)
-                    match_to_send = MatchToSend(self.bot, game, participant, player_account_row, champion)
-                    await self.send_match(
-                        match_to_send,
-                        [RecipientTuple(channel_id=row["channel_id"], spoil=row["spoil"]) for row in rows],
-                    )
+                candidates.append((player_account_row, game, participant))
+
+        if not candidates:
+            return
+
+        await self.prefetch_notified_channels(self.live_match_ids, key_column="champion_id")
+
+        for player_account_row, game, participant in candidates:
+            query = """
+                SELECT s.channel_id, s.spoil
+                FROM lol_favourite_characters c
+                JOIN lol_favourite_players p on c.guild_id = p.guild_id
+                JOIN lol_settings s on s.guild_id = c.guild_id
+                WHERE character_id=$1
+                    AND player_id=$2
+                    AND s.enabled = TRUE;
+            """
+            rows: list[GetRecipientsQueryRow] = await self.bot.pool.fetch(
+                query,
+                participant["championId"],
+                player_account_row["player_id"],
+            )
+            recipients = self.exclude_notified_channels(
+                game["gameId"],
+                participant["championId"],
+                [RecipientTuple(channel_id=row["channel_id"], spoil=row["spoil"]) for row in rows],
+            )
+
+            if recipients:
+                champion = await self.bot.lol.champions.by_id(participant["championId"])
+                log.debug("Notif %s - %s", player_account_row["display_name"], champion.display_name)
+                match_to_send = MatchToSend(self.bot, game, participant, player_account_row, champion)
+                await self.send_match(match_to_send, recipients)
 
     @aluloop(seconds=59)
     async def notification_worker(self) -> None:
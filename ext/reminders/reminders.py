@@ -181,13 +181,13 @@ class Reminder(RemindersCog, emote=const.Emote.DankG):
     async def remind_list(self, interaction: discord.Interaction[AluBot]) -> None:
         """Shows a list of your current reminders."""
         query = """
-            SELECT id, expires, extra #>> '{args,2}'
+            SELECT id, fires_at, data #>> '{text}'
             FROM timers
             WHERE event = 'reminder'
-            AND data #>> '{author_id}' = $1
-            ORDER BY expires
+            AND data @> $1::jsonb
+            ORDER BY fires_at
         """
-        records = await self.bot.pool.fetch(query, str(interaction.user.id))
+        records = await self.bot.pool.fetch(query, {"author_id": interaction.user.id})
 
         string_list = []
         for _id, expires, message in records:
@@ -239,9 +239,9 @@ class Reminder(RemindersCog, emote=const.Emote.DankG):
             DELETE FROM timers
             WHERE id=$1
             AND event = 'reminder'
-            AND data #>> '{author_id}' = $2;
+            AND data @> $2::jsonb;
         """
-        status = await interaction.client.pool.execute(query, id, str(interaction.user.id))
+        status = await interaction.client.pool.execute(query, id, {"author_id": interaction.user.id})
         if status == "DELETE 0":
             embed = discord.Embed(
                 colour=const.Colour.maroon,
@@ -265,10 +265,10 @@ class Reminder(RemindersCog, emote=const.Emote.DankG):
         query = """
             SELECT COUNT(*) FROM timers
             WHERE event = 'reminder'
-            AND data #>> '{author_id}' = $1;
+            AND data @> $1::jsonb;
         """
-        author_id = str(interaction.user.id)
-        total: int = await interaction.client.pool.fetchval(query, author_id)
+        author_data = {"author_id": interaction.user.id}
+        total: int = await interaction.client.pool.fetchval(query, author_data)
         if total == 0:
             no_reminders_embed = discord.Embed(
                 colour=interaction.user.colour,
@@ -287,9 +287,9 @@ class Reminder(RemindersCog, emote=const.Emote.DankG):
         query = """
             DELETE FROM timers
             WHERE event = 'reminder'
-            AND data #>> '{author_id}' = $1;
+            AND data @> $1::jsonb;
         """
-        await interaction.client.pool.execute(query, author_id)
+        await interaction.client.pool.execute(query, author_data)
 
         # Check if the current timer is the one being cleared and cancel it if so
         current_timer = self.bot._current_timer
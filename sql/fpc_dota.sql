@@ -54,9 +54,20 @@ CREATE TABLE IF NOT EXISTS dota_messages (
     match_id BIGINT NOT NULL,
     friend_id INTEGER NOT NULL,
     hero_id: INT NOT NULL,
-    player_name: TEXT --currently only used for logs so we don't double JOIN
+    player_name: TEXT, --currently only used for logs so we don't double JOIN
+
+    -- edit queue: Stratz 99% will not have the data in the first 5 minutes
+    -- so the first attempt is scheduled for later and then it backs off exponentially.
+    attempts INT NOT NULL DEFAULT 0,
+    next_attempt_at TIMESTAMPTZ NOT NULL DEFAULT (NOW() + INTERVAL '5 minutes')
 );
 
+-- migration for the existing `dota_messages` table
+ALTER TABLE dota_messages ADD COLUMN IF NOT EXISTS attempts INT NOT NULL DEFAULT 0;
+ALTER TABLE dota_messages ADD COLUMN IF NOT EXISTS next_attempt_at TIMESTAMPTZ NOT NULL DEFAULT (NOW() + INTERVAL '5 minutes');
+
+CREATE INDEX IF NOT EXISTS dota_messages_next_attempt_at_idx ON dota_messages (next_attempt_at);
+
 
 CREATE TABLE IF NOT EXISTS dota_heroes_info (
     id INT PRIMARY KEY,
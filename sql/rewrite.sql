@@ -28,9 +28,23 @@ CREATE TABLE IF NOT EXISTS timers (
     expires_at TIMESTAMP DEFAULT (NOW() at time zone 'utc'),
     created_at TIMESTAMP DEFAULT (NOW() at time zone 'utc'),
     timezone TEXT NOT NULL DEFAULT 'UTC',
-    data JSONB DEFAULT ('{}'::jsonb)
+    data JSONB DEFAULT ('{}'::jsonb),
+    -- normalised UTC moment when the timer fires (`expires_at` is naive UTC) so it can be indexed,
+    -- unlike expressions with per-row `timezone` conversions.
+    fires_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
 );
 
+-- migration for the existing `timers` table
+ALTER TABLE timers ADD COLUMN IF NOT EXISTS fires_at TIMESTAMPTZ;
+UPDATE timers SET fires_at = expires_at AT TIME ZONE 'UTC' WHERE fires_at IS NULL;
+ALTER TABLE timers ALTER COLUMN fires_at SET NOT NULL;
+ALTER TABLE timers ALTER COLUMN fires_at SET DEFAULT NOW();
+
+CREATE INDEX IF NOT EXISTS timers_fires_at_idx ON timers (fires_at);
+CREATE INDEX IF NOT EXISTS timers_event_idx ON timers (event);
+-- for `data @> $1::jsonb` lookups, i.e. `WHERE event = 'birthday' AND data @> '{"user_id": 123}'`
+CREATE INDEX IF NOT EXISTS timers_data_idx ON timers USING GIN (data jsonb_path_ops);
+
 CREATE TABLE IF NOT EXISTS user_settings (
     id BIGINT PRIMARY KEY, -- The discord user ID
     timezone TEXT -- The IANA alias of the timezone
@@ -4,8 +4,10 @@ import asyncio
 import enum
 import logging
 import time
+from collections import OrderedDict
+from collections.abc import MutableMapping
 from functools import wraps
-from typing import TYPE_CHECKING, Any, Protocol, TypeVar, override
+from typing import TYPE_CHECKING, Any, NamedTuple, Protocol, TypeVar, override
 
 from lru import LRU
 
@@ -13,7 +15,7 @@ log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Coroutine, Generator, MutableMapping
+    from collections.abc import Callable, Coroutine, Hashable, Iterator
 
 
 R = TypeVar("R")
@@ -21,72 +23,138 @@ R = TypeVar("R")
 
 # Can't use ParamSpec due to https://github.com/python/typing/discussions/946
 class CacheProtocol(Protocol[R]):
-    cache: MutableMapping[str, asyncio.Task[R]]
+    cache: MutableMapping[Hashable, asyncio.Task[R]]
 
     def __call__(self, *args: Any, **kwds: Any) -> asyncio.Task[R]:
         ...
 
-    def get_key(self, *args: Any, **kwargs: Any) -> str:
+    def get_key(self, *args: Any, **kwargs: Any) -> Hashable:
         ...
 
     def invalidate(self, *args: Any, **kwargs: Any) -> bool:
         ...
 
-    def invalidate_containing(self, key: str) -> None:
+    def invalidate_containing(self, arg: Any) -> None:
         ...
 
-    def get_stats(self) -> tuple[int, int]:
+    def get_stats(self) -> CacheStats:
+        ...
+
+    def clear(self) -> None:
         ...
 
 
-class ExpiringCache(dict[Any, Any]):
-    def __init__(self, seconds: float) -> None:
+class CacheStats(NamedTuple):
+    """Stats of `@cache.cache` decorated function."""
+
+    hits: int
+    misses: int
+    size: int
+    failed: int
+    """Amount of tasks that were evicted because they finished with an exception."""
+
+
+registry: dict[str, CacheProtocol[Any]] = {}
+"""Every `@cache.cache` decorated function, keyed by its qualified name."""
+
+
+class ExpiringCache(MutableMapping[Any, Any]):
+    """Mapping where entries expire `seconds` after they were set.
+
+    All entries share the same TTL so insertion order is also the expiry order.
+    Thus, expired entries are always at the front of the ordered dict and get evicted lazily
+    on access in amortised O(1) instead of scanning the whole cache on every lookup.
+
+    Parameters
+    ----------
+    seconds
+        Time to live for the entries.
+    maxsize
+        Optional size cap. The oldest entries get evicted when it's exceeded.
+    callback
+        Optional `callback(key, value)` called for evicted entries, same as in `LRU`.
+
+    """
+
+    def __init__(
+        self, seconds: float, maxsize: int | None = None, callback: Callable[[Any, Any], Any] | None = None,
+    ) -> None:
         self.__ttl: float = seconds
-        super().__init__()
+        self.__maxsize: int | None = maxsize
+        self.__callback: Callable[[Any, Any], Any] | None = callback
+        self.__data: OrderedDict[Any, tuple[Any, float]] = OrderedDict()
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
 
-    def __verify_cache_integrity(self) -> None:
-        # Have to do this in two steps...
+    def __evict_expired(self) -> None:
         current_time = time.monotonic()
-        to_remove = [k for (k, (_, t)) in super().items() if current_time > (t + self.__ttl)]
-        for k in to_remove:
-            del self[k]
+        while self.__data:
+            _, (_, expires_at) = next(iter(self.__data.items()))
+            if current_time <= expires_at:
+                break
+            self.__pop_oldest()
+
+    def __pop_oldest(self) -> None:
+        key, (value, _) = self.__data.popitem(last=False)
+        self.evictions += 1
+        if self.__callback is not None:
+            self.__callback(key, value)
+
+    @override
+    def __contains__(self, key: object) -> bool:
+        self.__evict_expired()
+        return key in self.__data
+
+    @override
+    def __getitem__(self, key: Any) -> Any:
+        self.__evict_expired()
+        try:
+            value, _ = self.__data[key]
+        except KeyError:
+            self.misses += 1
+            raise
+        self.hits += 1
+        return value
 
     @override
-    def __contains__(self, key: str) -> bool:
-        self.__verify_cache_integrity()
-        return super().__contains__(key)
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.__evict_expired()
+        self.__data[key] = (value, time.monotonic() + self.__ttl)
+        self.__data.move_to_end(key)
+        if self.__maxsize is not None:
+            while len(self.__data) > self.__maxsize:
+                self.__pop_oldest()
 
     @override
-    def __getitem__(self, key: str) -> Any:
-        self.__verify_cache_integrity()
-        v, _ = super().__getitem__(key)
-        return v
+    def __delitem__(self, key: Any) -> None:
+        del self.__data[key]
 
     @override
-    def __setitem__(self, key: str, value: Any) -> None:
-        super().__setitem__(key, (value, time.monotonic()))
+    def __iter__(self) -> Iterator[Any]:
+        self.__evict_expired()
+        return iter(list(self.__data))
 
     @override
-    def get(self, key: str, default: Any = None) -> Any:
-        self.__verify_cache_integrity()
-        v = super().get(key, default)
-        return default if v is default else v[0]
+    def __len__(self) -> int:
+        self.__evict_expired()
+        return len(self.__data)
 
     @override
-    def values(self) -> Generator[Any, None, None]:
-        return (x[0] for x in super().values())  # map(lambda x: x[0], super().values())
-        # https://docs.astral.sh/ruff/rules/unnecessary-map/
+    def get(self, key: Any, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
 
     @override
-    def items(self) -> Generator[tuple[Any, Any], None, None]:
-        """Generator `for key, value in items()` iterator.
+    def clear(self) -> None:
+        self.__data.clear()
 
-        Note that this function should be used like this:
-        >>> for (key, value) in self.items():
-        Whereas the `super().items()` function should be used when we need ttl:
-        >>> for (key, (value, ttl)) in super().items():
-        """
-        return ((x[0], x[1][0]) for x in super().items())  # map(lambda x: (x[0], x[1][0]), super().items())
+    def get_stats(self) -> tuple[int, int]:
+        """Get (hits, misses) stats, same as `LRU.get_stats`."""
+        return self.hits, self.misses
 
 
 class Strategy(enum.Enum):
@@ -95,32 +163,69 @@ class Strategy(enum.Enum):
     timed = 3
 
 
+def _hashable_or_repr(o: Any) -> Hashable:
+    try:
+        hash(o)
+    except TypeError:
+        return repr(o)
+    else:
+        return o
+
+
 def cache(
     maxsize: int = 128,
     strategy: Strategy = Strategy.lru,
     ignore_kwargs: bool = False,
+    ttl: float | None = None,
 ) -> Callable[[Callable[..., Coroutine[Any, Any, R]]], CacheProtocol[R]]:
+    """Cache the tasks of the decorated coroutine function.
+
+    Tasks that finish with an exception (or get cancelled) are evicted from the cache
+    so the following calls retry instead of re-raising the same error forever.
+
+    Parameters
+    ----------
+    maxsize
+        Max amount of entries for `Strategy.lru` or time-to-live in seconds for `Strategy.timed`.
+    strategy
+        Cache strategy.
+    ignore_kwargs
+        Whether keyword arguments should be ignored when making the cache key.
+    ttl
+        Optional time-to-live in seconds for each entry on top of the strategy, i.e. LRU with expiring entries.
+
+    """
+
     def decorator(func: Callable[..., Coroutine[Any, Any, R]]) -> CacheProtocol[R]:
+        # secondary index: argument -> cache keys that have it, so `invalidate_containing` is O(matches)
+        key_index: dict[Hashable, set[tuple[Hashable, ...]]] = {}
+
+        def _unindex(key: tuple[Hashable, ...], _value: Any = None) -> None:
+            for part in key:
+                if (keys := key_index.get(part)) is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del key_index[part]
+
         if strategy is Strategy.lru:
-            _internal_cache = LRU(maxsize)
-            _stats = _internal_cache.get_stats
+            _internal_cache = LRU(maxsize, callback=_unindex)
         elif strategy is Strategy.raw:
             _internal_cache = {}
-            _stats = lambda: (0, 0)
         elif strategy is Strategy.timed:
-            _internal_cache = ExpiringCache(seconds=maxsize)
-            _stats = lambda: (0, 0)
+            _internal_cache = ExpiringCache(seconds=maxsize, callback=_unindex)
 
-        def _make_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+        hits = misses = failed = 0
+
+        def _make_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> tuple[Hashable, ...]:
             # this is a bit of a cluster fuck
             # we do care what 'self' parameter is when we __repr__ it
-            def _true_repr(o: Any) -> str:
+            # so objects with default __repr__ (i.e. cogs, clients) are keyed by their class name.
+            def _true_key(o: Any) -> Any:
                 if o.__class__.__repr__ is object.__repr__:
                     return f"<{o.__class__.__module__}.{o.__class__.__name__}>"
-                return repr(o)
+                return o
 
-            key = [f"{func.__module__}.{func.__name__}"]
-            key.extend(_true_repr(o) for o in args)
+            key = [_true_key(o) for o in args]
             if not ignore_kwargs:
                 for k, v in kwargs.items():
                     # note: this only really works for this use case in particular
@@ -130,44 +235,79 @@ def cache(
                     if k == "connection" or k == "pool":
                         continue
 
-                    key.append(_true_repr(k))
-                    key.append(_true_repr(v))
+                    key.append(k)
+                    key.append(_true_key(v))
+
+            try:
+                hash(tuple_key := tuple(key))
+            except TypeError:
+                # fallback to repr for unhashable arguments, i.e. lists or dicts
+                return tuple(_hashable_or_repr(o) for o in key)
+            else:
+                return tuple_key
+
+        def _evict(key: tuple[Hashable, ...], task: asyncio.Task[Any]) -> None:
+            # the key might be already holding a newer task
+            if _internal_cache.get(key) is task:
+                del _internal_cache[key]
+                _unindex(key)
 
-            return ":".join(key)
+        def _evict_failed(key: tuple[Hashable, ...], task: asyncio.Task[Any]) -> None:
+            nonlocal failed
+            if task.cancelled() or task.exception() is not None:
+                failed += 1
+                _evict(key, task)
 
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> asyncio.Task[Any]:  # is it proper type?
+            nonlocal hits, misses
             key = _make_key(args, kwargs)
             try:
                 task = _internal_cache[key]
             except KeyError:
+                misses += 1
                 _internal_cache[key] = task = asyncio.create_task(func(*args, **kwargs))
+                for part in key:
+                    key_index.setdefault(part, set()).add(key)
+                task.add_done_callback(lambda t: _evict_failed(key, t))
+                if ttl is not None:
+                    task.get_loop().call_later(ttl, _evict, key, task)
                 return task
             else:
+                hits += 1
                 return task
 
         def _invalidate(*args: Any, **kwargs: Any) -> bool:
+            key = _make_key(args, kwargs)
             try:
-                del _internal_cache[_make_key(args, kwargs)]
+                del _internal_cache[key]
             except KeyError:
                 return False
             else:
+                _unindex(key)
                 return True
 
-        def _invalidate_containing(key: str) -> None:
-            to_remove = [k for k in _internal_cache if key in k]
-            for k in to_remove:
-                try:
-                    del _internal_cache[k]
-                except KeyError:
-                    continue
+        def _invalidate_containing(arg: Any) -> None:
+            """Invalidate all entries that have `arg` as one of their arguments."""
+            for key in list(key_index.get(_hashable_or_repr(arg), ())):
+                _internal_cache.pop(key, None)
+                _unindex(key)
+
+        def _clear() -> None:
+            _internal_cache.clear()
+            key_index.clear()
+
+        def _get_stats() -> CacheStats:
+            return CacheStats(hits=hits, misses=misses, size=len(_internal_cache), failed=failed)
 
         # TODO: investigate those "type: ignore"
         wrapper.cache = _internal_cache  # type: ignore
         wrapper.get_key = lambda *args, **kwargs: _make_key(args, kwargs)  # type: ignore
         wrapper.invalidate = _invalidate  # type: ignore
-        wrapper.get_stats = _stats  # type: ignore
+        wrapper.get_stats = _get_stats  # type: ignore
         wrapper.invalidate_containing = _invalidate_containing  # type: ignore
+        wrapper.clear = _clear  # type: ignore
+        registry[f"{func.__module__}.{func.__qualname__}"] = wrapper  # type: ignore
         return wrapper  # type: ignore
 
     return decorator
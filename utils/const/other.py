@@ -146,6 +146,12 @@ class Dota(CONSTANTS):
     TALENT_TREE_ICON = "https://liquipedia.net/commons/images/5/54/Talents.png"
     ATTR_BONUS_ICON = "https://static.wikia.nocookie.net/dota2_gamepedia/images/e/e2/Attribute_Bonus_icon.png"
 
+    # sizes of icons in FPC notification images; storages keep icons pre-resized to these in their icon atlases
+    HERO_TOPBAR_ICON_SIZE = (62, 35)
+    ITEM_ICON_SIZE = (69, 50)  # matches 88/64 in proportion (original size)
+    ABILITY_ICON_SIZE = (37, 37)
+    FACET_ICON_SIZE = (39, 39)
+
     AGHANIMS_SCEPTER_ITEM_ID = 108
     AGHANIMS_BLESSING_ITEM_ID = 271
     AGHANIMS_SHARD_ITEM_ID = 609
@@ -33,17 +33,42 @@ PS for more understanding:
     click "DotRecord(asyncpg.Record)" declaration for its supported methods.
     This is why if Python ever introduces possibility to extend the capability of typed dict
     (e.g. We can bind it to something else's getitem etc) we can't really type-hint Record properly.
+
+# Section #1. Pool Profile
+
+`create_pool` takes a `PoolProfile` with the pool sizing and the prepared statements cache settings.
+The default profile caches prepared statements, so hot queries (i.e. the per-message ones in `ext/community/levels.py`)
+are parsed and planned by Postgres only once per connection. This only works with a direct connection -
+if the bot ever connects through pgbouncer (in transaction/statement pooling mode) use `PGBOUNCER_PROFILE`.
+
+The pool also collects `PoolMetrics`: how long we wait to acquire a connection and how long queries take.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, override
+import logging
+import time
+from typing import TYPE_CHECKING, Any, NamedTuple, override
 
 import asyncpg
 import orjson
 
 from config import POSTGRES_URL
 
+__all__ = (
+    "DEFAULT_PROFILE",
+    "PGBOUNCER_PROFILE",
+    "DotRecord",
+    "MetricsPool",
+    "PoolMetrics",
+    "PoolProfile",
+    "TimingStats",
+    "create_pool",
+)
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
 
 # @deprecated("Just use dictionary notations.")  # from warnings import deprecated # TODO: 3.13
 class DotRecord(asyncpg.Record):
@@ -58,9 +83,101 @@ class DotRecord(asyncpg.Record):
         return self[name]
 
 
+class PoolProfile(NamedTuple):
+    """Settings of the database connection pool."""
+
+    min_size: int = 5
+    """Amount of connections the pool is initialised with and keeps even when they are idle."""
+    max_size: int = 20
+    max_inactive_connection_lifetime: float = 300.0
+    """Seconds after which idle connections above `min_size` are closed."""
+    statement_cache_size: int = 256
+    """Size of prepared statements cache per connection. Must be `0` if the connection goes through pgbouncer."""
+    command_timeout: float = 60.0
+    slow_query_threshold: float = 1.0
+    """Queries that take longer than this amount of seconds are logged."""
+
+
+DEFAULT_PROFILE = PoolProfile()
+PGBOUNCER_PROFILE = PoolProfile(statement_cache_size=0)
+
+
+class TimingStats:
+    """Running count/total/max of measured timings (in seconds)."""
+
+    __slots__: tuple[str, ...] = ("count", "max", "total")
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+
+    def add(self, elapsed: float) -> None:
+        """Account for a new measurement."""
+        self.count += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+
+    @property
+    def mean(self) -> float:
+        """Average measurement."""
+        return self.total / self.count if self.count else 0.0
+
+    def reset(self) -> None:
+        """Forget all measurements."""
+        self.count, self.total, self.max = 0, 0.0, 0.0
+
+
+class PoolMetrics:
+    """Metrics of the database connection pool."""
+
+    __slots__: tuple[str, ...] = ("acquire_wait", "failed_queries", "query_time", "slow_query_threshold")
+
+    def __init__(self, *, slow_query_threshold: float) -> None:
+        self.acquire_wait: TimingStats = TimingStats()
+        self.query_time: TimingStats = TimingStats()
+        self.failed_queries: int = 0
+        self.slow_query_threshold: float = slow_query_threshold
+
+    def on_query(self, record: asyncpg.connection.LoggedQuery) -> None:
+        """Query logger callback, see `asyncpg.Connection.add_query_logger`."""
+        self.query_time.add(record.elapsed)
+        if record.exception is not None:
+            self.failed_queries += 1
+        if record.elapsed > self.slow_query_threshold:
+            log.warning("Slow query (%.2fs): %s", record.elapsed, record.query)
+
+    def reset(self) -> None:
+        """Forget all measurements."""
+        self.acquire_wait.reset()
+        self.query_time.reset()
+        self.failed_queries = 0
+
+
+class MetricsPool(asyncpg.Pool):  # pyright: ignore[reportMissingTypeArgument]
+    """Connection pool that measures how long acquiring connections takes.
+
+    Query timings are collected with a query logger that `create_pool` adds to every connection.
+    """
+
+    __slots__: tuple[str, ...] = ("metrics",)
+
+    def __init__(self, *args: Any, metrics: PoolMetrics, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics: PoolMetrics = metrics
+
+    # `Pool.acquire()` and all `Pool.fetch`-like shortcuts go through this method
+    async def _acquire(self, timeout: float | None) -> Any:
+        start = time.perf_counter()
+        try:
+            return await super()._acquire(timeout)  # pyright: ignore[reportAttributeAccessIssue]
+        finally:
+            self.metrics.acquire_wait.add(time.perf_counter() - start)
+
+
 if TYPE_CHECKING:
 
-    class PoolTypedWithAny(asyncpg.Pool[asyncpg.Record]):
+    class PoolTypedWithAny(MetricsPool, asyncpg.Pool[asyncpg.Record]):
         """Fake Type Class.
 
         For typing purposes, our `bot.pool` will be "type-ignore"'d-as `PoolTypedWithAny`
@@ -85,14 +202,24 @@ if TYPE_CHECKING:
             ...
 
 
-async def create_pool() -> asyncpg.Pool[asyncpg.Record]:
-    """Create a database connection pool."""
+async def create_pool(profile: PoolProfile = DEFAULT_PROFILE) -> MetricsPool:
+    """Create a database connection pool.
+
+    Parameters
+    ----------
+    profile : PoolProfile
+        Pool sizing and prepared statements cache settings.
+
+    """
+
+    def _encode_jsonb(value: Any) -> bytes:
+        # binary jsonb format is the version byte followed by the json text
+        return b"\x01" + orjson.dumps(value)
 
-    def _encode_jsonb(value: Any) -> str:
-        return orjson.dumps(value).decode("utf-8")
+    def _decode_jsonb(value: bytes) -> Any:
+        return orjson.loads(value[1:])
 
-    def _decode_jsonb(value: str) -> Any:
-        return orjson.loads(value)
+    metrics = PoolMetrics(slow_query_threshold=profile.slow_query_threshold)
 
     async def init(con: asyncpg.Connection[asyncpg.Record]) -> None:
         await con.set_type_codec(
@@ -100,15 +227,22 @@ async def create_pool() -> asyncpg.Pool[asyncpg.Record]:
             schema="pg_catalog",
             encoder=_encode_jsonb,
             decoder=_decode_jsonb,
-            format="text",
+            format="binary",
         )
+        con.add_query_logger(metrics.on_query)
 
-    return await asyncpg.create_pool(
+    return await MetricsPool(
         POSTGRES_URL,
+        metrics=metrics,
         init=init,
-        command_timeout=60,
-        min_size=20,
-        max_size=20,
+        command_timeout=profile.command_timeout,
+        min_size=profile.min_size,
+        max_size=profile.max_size,
+        max_queries=50000,
+        max_inactive_connection_lifetime=profile.max_inactive_connection_lifetime,
+        connection_class=asyncpg.Connection,
+        record_class=asyncpg.Record,
+        loop=None,
         # record_class=DotRecord,  # deprecated
-        statement_cache_size=0,
-    )  # pyright: ignore[reportReturnType]
+        statement_cache_size=profile.statement_cache_size,
+    )
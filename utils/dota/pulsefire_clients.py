@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import collections
+import logging
 import random
 import time
 from typing import TYPE_CHECKING, Any, override
@@ -38,6 +39,9 @@ __all__ = (
 
 type HeaderRateLimitInfo = Mapping[str, Sequence[tuple[int, int]]]
 
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
 
 class DotaAPIsRateLimiter(BaseRateLimiter):
     """Dota 2 APIs rate limiter.
@@ -298,7 +302,7 @@ class StratzClient(BaseClient):
             middlewares=[
                 json_response_middleware(orjson.loads),
                 http_error_middleware(),
-                # rate_limiter_middleware(self.rate_limiter),
+                rate_limiter_middleware(self.rate_limiter),
             ],
         )
 
@@ -326,43 +330,144 @@ class StratzClient(BaseClient):
 
     async def get_fpc_match_to_edit(self, *, match_id: int, friend_id: int) -> stratz.FPCMatchesResponse:
         """Queries info that I need to know in order to edit Dota 2 FPC notification."""
-        query = """
-query GetFPCMatchToEdit ($match_id: Long!, $friend_id: Long!) {
-    match(id: $match_id) {
+        responses = await self.get_fpc_matches_to_edit([(match_id, friend_id)])
+        return responses[match_id, friend_id]
+
+    async def get_fpc_matches_to_edit(
+        self, pairs: list[tuple[int, int]],
+    ) -> dict[tuple[int, int], stratz.FPCMatchesResponse]:
+        """Batched `get_fpc_match_to_edit` - queries several matches in one request with GraphQL aliases.
+
+        Parameters
+        ----------
+        pairs:
+            List of `(match_id, friend_id)` tuples. Keep it reasonably short (~10),
+            Stratz has a limit on query complexity.
+
+        Returns
+        -------
+        dict[tuple[int, int], stratz.FPCMatchesResponse]
+            Mapping `(match_id, friend_id) -> response` where each response is split back into
+            the shape of a single `GetFPCMatchToEdit` query, i.e. `{"data": {"match": ...}}`.
+
+        """
+        match_query = """
+    m{i}: match(id: $match_id_{i}) {{
         statsDateTime
-        players(steamAccountId: $friend_id) {
-            isVictory
-            heroId
-            variant
-            kills
-            deaths
-            assists
-            item0Id
-            item1Id
-            item2Id
-            item3Id
-            item4Id
-            item5Id
-            neutral0Id
-            playbackData {
-                abilityLearnEvents {
-                    abilityId
-                }
-                purchaseEvents {
-                    time
-                    itemId
-                }
-            }
-            stats {
-                matchPlayerBuffEvent {
-                    itemId
-                }
-            }
-        }
-    }
-}"""
-        json = {"query": query, "variables": {"match_id": match_id, "friend_id": friend_id}}
-        return await self.invoke_with_try(query, json)
+        players(steamAccountId: $friend_id_{i}) {{
+            ...FPCMatchToEditPlayer
+        }}
+    }}"""
+        arguments = ", ".join(f"$match_id_{i}: Long!, $friend_id_{i}: Long!" for i in range(len(pairs)))
+        aliases = "".join(match_query.format(i=i) for i in range(len(pairs)))
+        query = f"""
+query GetFPCMatchesToEdit ({arguments}) {{{aliases}
+}}
+
+fragment FPCMatchToEditPlayer on MatchPlayerType {{
+    isVictory
+    heroId
+    variant
+    kills
+    deaths
+    assists
+    item0Id
+    item1Id
+    item2Id
+    item3Id
+    item4Id
+    item5Id
+    neutral0Id
+    playbackData {{
+        abilityLearnEvents {{
+            abilityId
+        }}
+        purchaseEvents {{
+            time
+            itemId
+        }}
+    }}
+    stats {{
+        matchPlayerBuffEvent {{
+            itemId
+        }}
+    }}
+}}"""
+        variables: dict[str, int] = {}
+        for i, (match_id, friend_id) in enumerate(pairs):
+            variables[f"match_id_{i}"] = match_id
+            variables[f"friend_id_{i}"] = friend_id
+        json = {"query": query, "variables": variables}
+        response = await self.invoke_with_try(query, json)
+
+        # one broken match only nulls its own alias (with an entry in "errors") so we validate them one by one
+        data: dict[str, Any] = response.get("data") or {}
+        result: dict[tuple[int, int], stratz.FPCMatchesResponse] = {}
+        for i, (match_id, friend_id) in enumerate(pairs):
+            match = data.get(f"m{i}")
+            if match is not None and (problem := self.validate_fpc_match_to_edit(match)):
+                # malformed response, treat it the same way as Stratz not having the match yet
+                log.warning(
+                    "Stratz returned malformed match data for match_id=%s friend_id=%s: %s. Errors: %s",
+                    match_id,
+                    friend_id,
+                    problem,
+                    response.get("errors"),
+                )
+                match = None
+            result[match_id, friend_id] = {"data": {"match": match}}  # type: ignore # validated above
+        return result
+
+    @staticmethod
+    def validate_fpc_match_to_edit(match: Any) -> str | None:  # noqa: PLR0911
+        """Check that the match from `get_fpc_matches_to_edit` has the fields that the FPC notification editor reads.
+
+        Returns
+        -------
+        str | None
+            Description of the problem or `None` if the match is fine.
+
+        """
+        if not isinstance(match, dict):
+            return "`match` is not an object"
+        players = match.get("players")
+        if not isinstance(players, list) or not players or not isinstance(player := players[0], dict):
+            return "`players` is not a non-empty list of objects"
+        if not match.get("statsDateTime"):
+            # the match is not parsed yet - the editor only tries again later without reading the rest
+            return None
+
+        for key in ("heroId", "variant", "kills", "deaths", "assists"):
+            if not isinstance(player.get(key), int):
+                return f"`{key}` is not an integer"
+        if not isinstance(player.get("isVictory"), bool):
+            return "`isVictory` is not a boolean"
+        for key in (*(f"item{i}Id" for i in range(6)), "neutral0Id"):
+            if not isinstance(player.get(key), int | None):
+                return f"`{key}` is not an integer or null"
+
+        stats = player.get("stats")
+        if not isinstance(stats, dict) or not isinstance(buff_events := stats.get("matchPlayerBuffEvent"), list):
+            return "`stats.matchPlayerBuffEvent` is not a list"
+        if not all(isinstance(event, dict) for event in buff_events):
+            return "`stats.matchPlayerBuffEvent` has non-object entries"
+
+        playback = player.get("playbackData")
+        if playback is not None:
+            if not isinstance(playback, dict):
+                return "`playbackData` is not an object"
+            ability_events = playback.get("abilityLearnEvents")
+            if not isinstance(ability_events, list) or not all(
+                isinstance(event, dict) and isinstance(event.get("abilityId"), int) for event in ability_events
+            ):
+                return "`playbackData.abilityLearnEvents` is malformed"
+            purchase_events = playback.get("purchaseEvents")
+            if not isinstance(purchase_events, list) or not all(
+                isinstance(event, dict) and isinstance(event.get("time"), int) and isinstance(event.get("itemId"), int)
+                for event in purchase_events
+            ):
+                return "`playbackData.purchaseEvents` is malformed"
+        return None
 
     async def get_heroes(self) -> stratz.HeroesResponse:
         """Queries Dota 2 Hero Constants."""
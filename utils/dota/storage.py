@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, TypedDict, override
+from typing import TYPE_CHECKING, Any, ClassVar, TypedDict, override
 
 import discord
 
 from .. import const, formats
-from ..fpc import Character, CharacterStorage, CharacterTransformer, GameDataStorage
+from ..fpc import Character, CharacterStorage, CharacterTransformer, IconStorage
 
 if TYPE_CHECKING:
     from bot import AluBot
@@ -33,7 +34,7 @@ __all__ = (
 CDN_REACT = "https://cdn.akamai.steamstatic.com/apps/dota2/images/dota_react/"
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True, frozen=True)
 class Hero(Character):
     short_name: str
     """A short name for the hero, i.e. `"dark_willow"`.
@@ -59,28 +60,28 @@ class Hero(Character):
     This value is also different from "facet slot id" which is simply 0 1 2... index
     """
 
-    @property
-    def topbar_icon_url(self) -> str:
-        """Hero icon for the in-game topbar with all heroes and score.
+    topbar_icon_url: str = field(init=False)
+    """Hero icon for the in-game topbar with all heroes and score.
 
-        Examples
-        --------
-        "https://cdn.akamai.steamstatic.com/apps/dota2/images/dota_react/heroes/alchemist.png"
-        """
-        return f"{CDN_REACT}/heroes/{self.short_name}.png"
+    Examples
+    --------
+    "https://cdn.akamai.steamstatic.com/apps/dota2/images/dota_react/heroes/alchemist.png"
+    """
+    minimap_icon_url: str = field(init=False)
+    """Hero icon for the minimap. Somewhat represents small pixel art for the hero.
 
-    @property
-    def minimap_icon_url(self) -> str:
-        """Hero icon for the minimap. Somewhat represents small pixel art for the hero.
+    Examples
+    --------
+    "https://cdn.cloudflare.steamstatic.com/apps/dota2/images/dota_react/heroes/icons/hoodwink.png"
+    """
 
-        Examples
-        --------
-        "https://cdn.cloudflare.steamstatic.com/apps/dota2/images/dota_react/heroes/icons/hoodwink.png"
-        """
-        return f"{CDN_REACT}/heroes/icons/{self.short_name}.png"
+    def __post_init__(self) -> None:
+        # precompute the urls once, so render paths don't build the strings on every access
+        object.__setattr__(self, "topbar_icon_url", f"{CDN_REACT}/heroes/{self.short_name}.png")
+        object.__setattr__(self, "minimap_icon_url", f"{CDN_REACT}/heroes/icons/{self.short_name}.png")
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True, frozen=True)
 class PseudoHero(Character):
     short_name: str
 
@@ -91,7 +92,18 @@ class PseudoHero(Character):
     facet_ids: list[int] = field(default_factory=list)
 
 
-class Heroes(CharacterStorage[Hero, PseudoHero]):  # CharacterCache
+class Heroes(CharacterStorage[Hero, PseudoHero], IconStorage[Hero, PseudoHero]):  # CharacterCache
+    icon_tile_sizes = (const.Dota.HERO_TOPBAR_ICON_SIZE,)
+
+    disconnected_or_unpicked: ClassVar[PseudoHero] = PseudoHero(
+        id=0,
+        short_name="disconnected_or_unpicked",
+        display_name="Disconnected/Unpicked",
+        topbar_icon_url=const.DotaAsset.HeroTopbarDisconnectedUnpicked,
+        emote="\N{BLACK QUESTION MARK ORNAMENT}",
+    )
+    special_objects: ClassVar[dict[int, PseudoHero]] = {0: disconnected_or_unpicked}
+
     @override
     async def fill_data(self) -> dict[int, Hero]:
         heroes = await self.bot.dota.stratz.get_heroes()
@@ -113,8 +125,25 @@ class Heroes(CharacterStorage[Hero, PseudoHero]):  # CharacterCache
             for hero in heroes["data"]["constants"]["heroes"]
         }
 
+    @override
+    def load_value(self, raw: Any) -> Hero:
+        return self.load_dataclass(Hero, raw)
+
+    @override
+    def get_aliases(self, character: Hero) -> list[str]:
+        return [character.short_name]
+
+    @override
+    def get_asset_urls(self) -> list[str]:
+        return [hero.topbar_icon_url for hero in self.cached_data.values()]
+
+    @override
+    def get_icon_url(self, value: Hero | PseudoHero) -> str:
+        return value.topbar_icon_url
+
     @override
     @staticmethod
+    @functools.cache
     def generate_unknown_object(hero_id: int) -> PseudoHero:
         return PseudoHero(
             id=hero_id,
@@ -124,20 +153,6 @@ class Heroes(CharacterStorage[Hero, PseudoHero]):  # CharacterCache
             emote=const.NEW_HERO_EMOTE,
         )
 
-    @override
-    async def by_id(self, hero_id: int) -> Hero | PseudoHero:
-        """Get Hero object by its ID."""
-        # special cases
-        if hero_id == 0:
-            return PseudoHero(
-                id=0,
-                short_name="disconnected_or_unpicked",
-                display_name="Disconnected/Unpicked",
-                topbar_icon_url=const.DotaAsset.HeroTopbarDisconnectedUnpicked,
-                emote="\N{BLACK QUESTION MARK ORNAMENT}",
-            )
-        return await super().by_id(hero_id)
-
     async def create_hero_emote(
         self,
         hero_id: int,
@@ -166,7 +181,7 @@ class HeroTransformer(CharacterTransformer[Hero, PseudoHero]):
         return interaction.client.dota.heroes
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Ability:
     """Class describing Dota 2 Hero Ability.
 
@@ -177,17 +192,18 @@ class Ability:
     name: str
     display_name: str
     is_talent: bool
+    icon_url: str = field(init=False)
 
-    @property
-    def icon_url(self) -> str:
-        return const.TALENT_TREE_ICON if self.is_talent else f"{CDN_REACT}/abilities/{self.name}.png"
+    def __post_init__(self) -> None:
+        icon_url = const.TALENT_TREE_ICON if self.is_talent else f"{CDN_REACT}/abilities/{self.name}.png"
+        object.__setattr__(self, "icon_url", icon_url)
 
     @override
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} id={self.id} {self.display_name}>"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PseudoAbility:
     id: int
     name: str
@@ -200,7 +216,9 @@ class PseudoAbility:
         return f"<{self.__class__.__name__} id={self.id} {self.display_name}>"
 
 
-class Abilities(GameDataStorage[Ability, PseudoAbility]):
+class Abilities(IconStorage[Ability, PseudoAbility]):
+    # there are thousands of abilities so their tiles are only filled lazily (no `icon_tile_sizes`)
+
     @override
     async def fill_data(self) -> dict[int, Ability]:
         abilities = await self.bot.dota.stratz.get_abilities()
@@ -229,8 +247,13 @@ class Abilities(GameDataStorage[Ability, PseudoAbility]):
             for ability in abilities["data"]["constants"]["abilities"]
         }
 
+    @override
+    def load_value(self, raw: Any) -> Ability:
+        return self.load_dataclass(Ability, raw)
+
     @override
     @staticmethod
+    @functools.cache
     def generate_unknown_object(ability_id: int) -> PseudoAbility:
         return PseudoAbility(
             id=ability_id,
@@ -240,31 +263,34 @@ class Abilities(GameDataStorage[Ability, PseudoAbility]):
             icon_url=const.DotaAsset.AbilityUnknown,
         )
 
+    @override
+    def get_icon_url(self, value: Ability | PseudoAbility) -> str:
+        return value.icon_url
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Item:
     id: int
     short_name: str
+    icon_url: str = field(init=False)
+    """Item's icon url.
 
-    @property
-    def icon_url(self) -> str:
-        """Get item's `icon_url` id by its `item_id`.
+    Examples
+    --------
+    <Item id=1076> -> "https://cdn.akamai.steamstatic.com/apps/dota2/images/dota_react/items/specialists_array.png"
+    """
 
-        Examples
-        --------
-        <Item id=1076> -> "https://cdn.akamai.steamstatic.com/apps/dota2/images/dota_react/items/specialists_array.png"
-        """
-        if self.short_name.startswith("recipe_"):
-            # all recipes fall back to a common recipe icon
-            return f"{CDN_REACT}/items/recipe.png"
-        return f"{CDN_REACT}/items/{self.short_name}.png"
+    def __post_init__(self) -> None:
+        # all recipes fall back to a common recipe icon
+        icon_name = "recipe" if self.short_name.startswith("recipe_") else self.short_name
+        object.__setattr__(self, "icon_url", f"{CDN_REACT}/items/{icon_name}.png")
 
     @override
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} id={self.id} {self.short_name}>"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PseudoItem:
     id: int
     short_name: str
@@ -275,7 +301,12 @@ class PseudoItem:
         return f"<{self.__class__.__name__} id={self.id} {self.short_name}>"
 
 
-class Items(GameDataStorage[Item, PseudoItem]):
+class Items(IconStorage[Item, PseudoItem]):
+    icon_tile_sizes = (const.Dota.ITEM_ICON_SIZE,)
+
+    empty_slot: ClassVar[PseudoItem] = PseudoItem(0, "Empty Slot", const.DotaAsset.ItemEmpty)
+    special_objects: ClassVar[dict[int, PseudoItem]] = {0: empty_slot}
+
     @override
     async def fill_data(self) -> dict[int, Item]:
         items = await self.bot.dota.stratz.get_items()
@@ -287,8 +318,21 @@ class Items(GameDataStorage[Item, PseudoItem]):
             for item in items["data"]["constants"]["items"]
         }
 
+    @override
+    def load_value(self, raw: Any) -> Item:
+        return self.load_dataclass(Item, raw)
+
+    @override
+    def get_asset_urls(self) -> list[str]:
+        return [item.icon_url for item in self.cached_data.values()]
+
+    @override
+    def get_icon_url(self, value: Item | PseudoItem) -> str:
+        return value.icon_url
+
     @override
     @staticmethod
+    @functools.cache
     def generate_unknown_object(item_id: int) -> PseudoItem:
         return PseudoItem(
             id=item_id,
@@ -296,42 +340,30 @@ class Items(GameDataStorage[Item, PseudoItem]):
             icon_url=const.DotaAsset.ItemUnknown,
         )
 
-    @override
-    async def by_id(self, item_id: int) -> Item | PseudoItem:
-        """Get Item by its ID."""
-        # special case
-        if item_id == 0:
-            return PseudoItem(
-                0,
-                "Empty Slot",
-                const.DotaAsset.ItemEmpty,
-            )
-        return await super().by_id(item_id)
-
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Facet:
     id: int
     display_name: str
     icon: str
     colour: str
+    icon_url: str = field(init=False)
+    """Facet's icon url.
 
-    @property
-    def icon_url(self) -> str:
-        """_summary_
+    Examples
+    --------
+    "https://cdn.akamai.steamstatic.com/apps/dota2/images/dota_react/icons/facets/mana.png"
+    """
 
-        Examples
-        --------
-        "https://cdn.akamai.steamstatic.com/apps/dota2/images/dota_react/icons/facets/mana.png"
-        """
-        return f"{CDN_REACT}/icons/facets/{self.icon}.png"
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "icon_url", f"{CDN_REACT}/icons/facets/{self.icon}.png")
 
     @override
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} id={self.id} {self.display_name}>"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PseudoFacet:
     id: int
     display_name: str
@@ -344,7 +376,9 @@ class PseudoFacet:
         return f"<{self.__class__.__name__} id={self.id} {self.display_name}>"
 
 
-class Facets(GameDataStorage[Facet, PseudoFacet]):
+class Facets(IconStorage[Facet, PseudoFacet]):
+    icon_tile_sizes = (const.Dota.FACET_ICON_SIZE,)
+
     @override
     async def fill_data(self) -> dict[int, Facet]:
         facets = await self.bot.dota.stratz.get_facets()
@@ -368,8 +402,21 @@ class Facets(GameDataStorage[Facet, PseudoFacet]):
             for facet in facets["data"]["constants"]["facets"]
         }
 
+    @override
+    def load_value(self, raw: Any) -> Facet:
+        return self.load_dataclass(Facet, raw)
+
+    @override
+    def get_asset_urls(self) -> list[str]:
+        return [facet.icon_url for facet in self.cached_data.values()]
+
+    @override
+    def get_icon_url(self, value: Facet | PseudoFacet) -> str:
+        return value.icon_url
+
     @override
     @staticmethod
+    @functools.cache
     def generate_unknown_object(facet_id: int) -> PseudoFacet:
         return PseudoFacet(
             id=facet_id,
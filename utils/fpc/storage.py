@@ -5,16 +5,22 @@ import asyncio
 import logging
 import random
 import time
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Generic, TypeVar, override
+from dataclasses import dataclass, fields
+from io import BytesIO
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypeVar, override
 
 import discord
+import orjson
 from discord import app_commands
+from PIL import Image
 
 from bot import aluloop
 from utils import const, errors, fuzzy
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from bot import AluBot
 
 __all__ = (
@@ -22,6 +28,7 @@ __all__ = (
     "CharacterStorage",
     "CharacterTransformer",
     "GameDataStorage",
+    "IconStorage",
 )
 
 log = logging.getLogger(__name__)
@@ -31,7 +38,7 @@ VT = TypeVar("VT")
 PseudoVT = TypeVar("PseudoVT")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Character:
     id: int
     display_name: str
@@ -74,14 +81,9 @@ class CharacterTransformer(app_commands.Transformer, abc.ABC, Generic[CharacterT
         current: str,
     ) -> list[app_commands.Choice[int]]:
         storage = self.get_character_storage(interaction)
-        characters = await storage.all()
-
-        options = fuzzy.finder(current, characters, key=lambda x: x.display_name)
+        options = await storage.search(current, limit=5)
         if not options:
-            characters.sort(key=lambda x: x.display_name)
-            options = characters[:5]
-        else:
-            options = options[:5]
+            options = await storage.search("", limit=5)
 
         return [app_commands.Choice(name=character.display_name, value=character.id) for character in options]
 
@@ -92,7 +94,8 @@ class GameDataStorage(abc.ABC, Generic[VT, PseudoVT]):
     Used for fetching and storing data from public API and JSONs.
     The concept is the data gets updated/refreshed once a day.
 
-    if KeyError arises - there is an attempt to refresh the data, otherwise it's assumed that the data is fine enough
+    if KeyError arises - the pseudo object is returned right away and a background refresh is triggered
+    (stale-while-revalidate), otherwise it's assumed that the data is fine enough
     (yes, it can backfire with an update where, for example, some item icon changes,
     but we still update storage once per day, so whatever).
     """
@@ -100,6 +103,18 @@ class GameDataStorage(abc.ABC, Generic[VT, PseudoVT]):
     if TYPE_CHECKING:
         cached_data: dict[int, VT]
 
+    special_objects: ClassVar[dict[int, Any]] = {}
+    """Objects for special ids that are not in the data, i.e. `0` for an empty item slot.
+
+    These are resolved before looking into `cached_data` and never trigger a refresh.
+    """
+
+    refresh_cooldown: ClassVar[float] = 600.0
+    """Minimum amount of seconds between two background refreshes triggered by unknown ids."""
+
+    snapshot_version: ClassVar[int] = 1
+    """Version of the on-disk snapshot format. Bump it when the stored objects change their fields."""
+
     def __init__(self, bot: AluBot) -> None:
         """__init__.
 
@@ -110,10 +125,15 @@ class GameDataStorage(abc.ABC, Generic[VT, PseudoVT]):
         """
         self.bot: AluBot = bot
         self.lock: asyncio.Lock = asyncio.Lock()
+        self.refresh_task: asyncio.Task[None] | None = None
+        self.assets_task: asyncio.Task[None] | None = None
+        self.last_updated_at: float = float("-inf")
 
     def start(self) -> None:
         """Start the storage tasks."""
         # self.update_data.add_exception_type(errors.ResponseNotOK)
+        # serve the last known data right away, the first `update_data` iteration refreshes it in the background
+        self.load_snapshot()
         # random times just so we don't have a possibility of all cache being updated at the same time
         self.update_data.change_interval(hours=24, minutes=random.randint(1, 59))
         self.update_data.start()
@@ -121,6 +141,10 @@ class GameDataStorage(abc.ABC, Generic[VT, PseudoVT]):
     def close(self) -> None:
         """Cancel the storage tasks."""
         self.update_data.cancel()
+        if self.refresh_task is not None:
+            self.refresh_task.cancel()
+        if self.assets_task is not None:
+            self.assets_task.cancel()
 
     async def fill_data(self) -> dict[int, VT]:
         """Fill self.cached_data with the data from various json data.
@@ -129,6 +153,81 @@ class GameDataStorage(abc.ABC, Generic[VT, PseudoVT]):
         We get the data and sort it out into a convenient dictionary to cache.
         """
 
+    def on_data_update(self) -> None:
+        """Hook that is called right after `cached_data` gets replaced with new data.
+
+        Subclasses can use it to (re-)build their derived structures, i.e. search indexes.
+        """
+
+    @property
+    def snapshot_path(self) -> Path:
+        """Path to the file with the snapshot of the storage data for warm starts."""
+        return Path(".temp/storage") / f"{self.__class__.__name__}.json"
+
+    def load_value(self, raw: Any) -> VT:
+        """Reconstruct storage object from its JSON representation in the snapshot.
+
+        Storages with dataclass objects are supposed to override this,
+        i.e. `return self.load_dataclass(Hero, raw)`.
+        """
+        return raw
+
+    @staticmethod
+    def load_dataclass[T](dataclass_type: type[T], raw: dict[str, Any]) -> T:
+        """Construct dataclass object from its JSON representation.
+
+        Fields that are computed in `__post_init__` (`init=False`), i.e. precomputed urls, are skipped.
+        """
+        return dataclass_type(**{f.name: raw[f.name] for f in fields(dataclass_type) if f.init})  # type: ignore
+
+    def load_snapshot(self) -> None:
+        """Load storage data from the snapshot file if there is a valid one.
+
+        It's done synchronously - the file is small and it's only done on `start()`.
+        """
+        try:
+            content = self.snapshot_path.read_bytes()
+        except FileNotFoundError:
+            return
+
+        try:
+            snapshot = orjson.loads(content)
+            if snapshot["version"] != self.snapshot_version:
+                log.info("Storage %s snapshot is outdated. Ignoring it.", self.__class__.__name__)
+                return
+            self.cached_data = {int(object_id): self.load_value(raw) for object_id, raw in snapshot["data"].items()}
+        except (orjson.JSONDecodeError, KeyError, TypeError, ValueError):
+            log.warning("Storage %s snapshot is corrupted. Ignoring it.", self.__class__.__name__, exc_info=True)
+        else:
+            self.on_data_update()
+            log.debug("Storage %s is loaded from the snapshot.", self.__class__.__name__)
+
+    async def save_snapshot(self) -> None:
+        """Save storage data into the snapshot file so the next start doesn't need to wait for the APIs."""
+        content = orjson.dumps(
+            {"version": self.snapshot_version, "data": self.cached_data},
+            option=orjson.OPT_NON_STR_KEYS,
+        )
+        path = self.snapshot_path
+
+        def write() -> None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(".tmp")
+            temp_path.write_bytes(content)
+            temp_path.replace(path)
+
+        try:
+            await asyncio.to_thread(write)
+        except OSError:
+            log.warning("Failed to save storage %s snapshot.", self.__class__.__name__, exc_info=True)
+
+    def get_asset_urls(self) -> list[str]:
+        """Get URLs of images (icons) that should be kept warm in the on-disk asset cache.
+
+        This function is supposed to be implemented by subclasses that have static images to cache.
+        """
+        return []
+
     @aluloop()
     async def update_data(self) -> None:
         """The task responsible for keeping the data up-to-date."""
@@ -136,12 +235,32 @@ class GameDataStorage(abc.ABC, Generic[VT, PseudoVT]):
         async with self.lock:
             start_time = time.perf_counter()
             self.cached_data = await self.fill_data()
+            self.last_updated_at = time.monotonic()
+            self.on_data_update()
+            await self.save_snapshot()
             log.debug(
                 "Storage %s %s is updated in %.3fs",
                 __package__.split(".")[-1].capitalize() if __package__ else "",
                 self.__class__.__name__,
                 time.perf_counter() - start_time,
             )
+        # assets take a while (hundreds of conditional requests) so nobody should wait for them,
+        # and the assets for the outdated data are not needed anymore
+        if self.assets_task is not None:
+            self.assets_task.cancel()
+        self.assets_task = asyncio.create_task(self.background_refresh_assets())
+
+    async def refresh_assets(self) -> None:
+        """Refresh assets derived from the data after `update_data`, i.e. warm the on-disk asset cache."""
+        await self.bot.transposer.prewarm_assets(self.get_asset_urls())
+
+    async def background_refresh_assets(self) -> None:
+        """Refresh the assets without anybody awaiting it, so errors need to be reported here."""
+        try:
+            await self.refresh_assets()
+        except Exception as exc:
+            embed = discord.Embed(description=f"Refreshing assets of `{self.__class__.__name__}` storage failed.")
+            await self.bot.exc_manager.register_error(exc, embed=embed)
 
     async def get_cached_data(self) -> dict[int, VT]:
         """Get the whole cached data."""
@@ -152,15 +271,45 @@ class GameDataStorage(abc.ABC, Generic[VT, PseudoVT]):
             return self.cached_data
 
     async def get_value(self, object_id: int) -> VT:
-        """Get value by the `key` from `self.cached_data`."""
+        """Get value by the `key` from `self.cached_data`.
+
+        Raises
+        ------
+        KeyError
+            The id is unknown to the current data. A deduplicated background refresh is scheduled
+            in case it's due to a new patch or something, but the callers don't wait for it.
+        """
+        try:
+            cached_data = self.cached_data
+        except AttributeError:
+            # the data is not initialized - then there is nothing to serve
+            # and we will get stuck in self.lock waiting for the data.
+            cached_data = await self.get_cached_data()
+
+        try:
+            return cached_data[object_id]
+        except KeyError:
+            self.schedule_refresh()
+            raise
+
+    def schedule_refresh(self) -> None:
+        """Schedule a background refresh of the data unless one is running or the previous one was too recent."""
+        if self.refresh_task is not None and not self.refresh_task.done():
+            return
+        if time.monotonic() - self.last_updated_at < self.refresh_cooldown:
+            return
+        self.refresh_task = asyncio.create_task(self.background_refresh())
+
+    async def background_refresh(self) -> None:
+        """Refresh the data without anybody awaiting it, so errors need to be reported here."""
+        log.info("Storage %s is refreshing in the background due to an unknown id.", self.__class__.__name__)
         try:
-            return self.cached_data[object_id]
-        except (KeyError, AttributeError):
-            # let's try to update the cache in case it's a KeyError due to
-            # * new patch or something
-            # * the data is not initialized then we will get stuck in self.lock waiting for the data.
             await self.update_data()
-            return self.cached_data[object_id]
+        except Exception as exc:
+            # still respect the cooldown so we don't spam the API while it's down
+            self.last_updated_at = time.monotonic()
+            embed = discord.Embed(description=f"Background refresh of `{self.__class__.__name__}` storage failed.")
+            await self.bot.exc_manager.register_error(exc, embed=embed)
 
     async def send_unknown_value_report(self, object_id: int) -> None:
         embed = discord.Embed(
@@ -176,11 +325,41 @@ class GameDataStorage(abc.ABC, Generic[VT, PseudoVT]):
 
     async def by_id(self, object_id: int) -> VT | PseudoVT:
         """Get storage object by its ID."""
+        if object_id in self.special_objects:
+            return self.special_objects[object_id]
         try:
             return await self.get_value(object_id)
         except KeyError:
             return self.generate_unknown_object(object_id)
 
+    async def by_ids(self, object_ids: Iterable[int]) -> list[VT | PseudoVT]:
+        """Get storage objects by their IDs.
+
+        All of them are resolved against the same snapshot of the data with at most one (background) refresh
+        for unknown ids, instead of awaiting `by_id` for each ID.
+        """
+        cached_data = await self.get_cached_data()
+
+        objects: list[VT | PseudoVT] = []
+        unknown_found = False
+        for object_id in object_ids:
+            if object_id in self.special_objects:
+                objects.append(self.special_objects[object_id])
+            elif (value := cached_data.get(object_id)) is not None:
+                objects.append(value)
+            else:
+                unknown_found = True
+                objects.append(self.generate_unknown_object(object_id))
+
+        if unknown_found:
+            self.schedule_refresh()
+        return objects
+
+    async def mapping(self, object_ids: Iterable[int]) -> dict[int, VT | PseudoVT]:
+        """Get `{object_id: object}` mapping for the IDs. Same as `by_ids`."""
+        object_ids = list(object_ids)
+        return dict(zip(object_ids, await self.by_ids(object_ids), strict=True))
+
     async def all(self) -> list[VT | PseudoVT]:
         data = await self.get_cached_data()
         return list(data.values())
@@ -229,4 +408,105 @@ class GameDataStorage(abc.ABC, Generic[VT, PseudoVT]):
         return str(new_emote)
 
 
-class CharacterStorage(GameDataStorage[CharacterT, PseudoCharacterT]): ...
+class IconStorage(GameDataStorage[VT, PseudoVT]):
+    """Game Data Storage for objects with icons.
+
+    Icons are kept decoded and resized in `icon_tiles` atlas so image renderers can paste them right away.
+    """
+
+    icon_tile_sizes: ClassVar[tuple[tuple[int, int], ...]] = ()
+    """Sizes of icons that are pre-resized into `icon_tiles` atlas for every object during `update_data`.
+
+    Other sizes (or storages with nothing here) still work with `icon_tile`, they are just filled lazily.
+    """
+
+    def __init__(self, bot: AluBot) -> None:
+        super().__init__(bot)
+        self.icon_tiles: dict[tuple[int, tuple[int, int]], Image.Image] = {}
+
+    @abc.abstractmethod
+    def get_icon_url(self, value: VT | PseudoVT) -> str:
+        """Get icon URL of the storage object."""
+
+    @override
+    async def refresh_assets(self) -> None:
+        await super().refresh_assets()
+        await self.build_icon_tiles()
+
+    async def build_icon_tiles(self) -> None:
+        """Build `icon_tiles` atlas: icons of all objects decoded and resized to `icon_tile_sizes`."""
+        if not self.icon_tile_sizes:
+            self.icon_tiles = {}
+            return
+
+        semaphore = asyncio.Semaphore(8)
+
+        async def download(value: VT) -> bytes:
+            async with semaphore:
+                return await self.bot.transposer.url_to_asset_bytes(self.get_icon_url(value))
+
+        results = await asyncio.gather(
+            *(download(value) for value in self.cached_data.values()),
+            return_exceptions=True,
+        )
+        icons: dict[int, bytes] = {}
+        for object_id, result in zip(self.cached_data, results, strict=True):
+            if isinstance(result, errors.ResponseNotOK):
+                # it will be tried again with `icon_tile`, which will raise properly if it's still missing
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            icons[object_id] = result
+
+        def build() -> dict[tuple[int, tuple[int, int]], Image.Image]:
+            tiles: dict[tuple[int, tuple[int, int]], Image.Image] = {}
+            for object_id, data in icons.items():
+                icon = Image.open(BytesIO(data)).convert("RGBA")
+                for size in self.icon_tile_sizes:
+                    tiles[object_id, size] = icon.resize(size)
+            return tiles
+
+        self.icon_tiles = await asyncio.to_thread(build)
+
+    async def icon_tile(self, object_id: int, size: tuple[int, int]) -> Image.Image:
+        """Get object's icon decoded and resized to `size` - ready to be pasted into an image.
+
+        The tile is shared so do not draw on it.
+        """
+        try:
+            return self.icon_tiles[object_id, size]
+        except KeyError:
+            url = self.get_icon_url(await self.by_id(object_id))
+            data = await self.bot.transposer.url_to_asset_bytes(url)
+            tile = await asyncio.to_thread(lambda: Image.open(BytesIO(data)).convert("RGBA").resize(size))
+            self.icon_tiles[object_id, size] = tile
+            return tile
+
+
+class CharacterStorage(GameDataStorage[CharacterT, PseudoCharacterT]):
+    def __init__(self, bot: AluBot) -> None:
+        super().__init__(bot)
+        self.search_index: fuzzy.SearchIndex[CharacterT] | None = None
+
+    def get_aliases(self, character: CharacterT) -> list[str]:
+        """Get extra searchable names for the character, i.e. short names.
+
+        This function is supposed to be implemented by subclasses if there are any aliases.
+        """
+        return []
+
+    @override
+    def on_data_update(self) -> None:
+        self.search_index = fuzzy.SearchIndex(
+            self.cached_data.values(),
+            key=lambda character: character.display_name,
+            aliases=self.get_aliases,
+        )
+
+    async def search(self, text: str, *, limit: int = 5) -> list[CharacterT]:
+        """Search characters by their names for `text` using precomputed search index."""
+        if self.search_index is None:
+            # the data is not initialized, `update_data` builds the index as well
+            await self.get_cached_data()
+        assert self.search_index is not None
+        return self.search_index.search(text, limit=limit)
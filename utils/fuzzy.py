@@ -366,3 +366,96 @@ def find(text: str, collection: Iterable[str], *, key: Callable[[str], str] | No
         return finder(text, collection, key=key)[0]
     except IndexError:
         return None
+
+
+_normalise_regex = re.compile(r"[^a-z0-9 ]")
+
+
+def _normalise(text: str) -> str:
+    return " ".join(_normalise_regex.sub("", text.lower().replace("_", " ").replace("-", " ")).split())
+
+
+def _trigrams(text: str) -> set[str]:
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex[T]:
+    """Precomputed index for quick autocomplete-like searches over a static collection.
+
+    It keeps normalised names (+ aliases), a prefix table (flattened prefix trie) for each name and each word in it
+    and trigram postings so each keystroke only looks at a small set of candidates
+    instead of running `finder` over the whole collection.
+
+    Parameters
+    ----------
+    collection
+        Items to search over.
+    key
+        Function to get the display name of an item. The results are sorted by it.
+    aliases
+        Optional function to get extra names of an item that should be searchable too.
+
+    """
+
+    def __init__(
+        self,
+        collection: Iterable[T],
+        *,
+        key: Callable[[T], str],
+        aliases: Callable[[T], Iterable[str]] | None = None,
+    ) -> None:
+        self.key: Callable[[T], str] = key
+        self.items: list[T] = sorted(collection, key=key)
+        self.names: list[list[str]] = []
+        self.prefixes: dict[str, list[int]] = {}
+        self.trigrams: dict[str, set[int]] = {}
+
+        for index, item in enumerate(self.items):
+            names = [_normalise(key(item)), *(_normalise(alias) for alias in (aliases(item) if aliases else ()))]
+            self.names.append(names)
+
+            prefixes: set[str] = set()
+            for name in names:
+                for word in (name, *name.split()):
+                    prefixes.update(word[:i] for i in range(1, len(word) + 1))
+                for trigram in _trigrams(name):
+                    self.trigrams.setdefault(trigram, set()).add(index)
+            for prefix in prefixes:
+                # indexes are added in sorted order so the postings stay sorted by `key` too
+                self.prefixes.setdefault(prefix, []).append(index)
+
+    def search(self, text: str, *, limit: int = 5) -> list[T]:
+        """Search the index for `text`.
+
+        Prefix matches go first, then the trigram candidates are ranked with `finder`.
+        Only if neither of them found anything - falls back to `finder` across all items
+        which keeps the same results for subsequence-like queries as before, i.e. "qop" -> "Queen of Pain".
+        """
+        query = _normalise(text)
+        if not query:
+            return self.items[:limit]
+
+        found = list(self.prefixes.get(query, ())[:limit])
+        if len(found) < limit:
+            candidates: set[int] = set()
+            for trigram in _trigrams(query):
+                candidates |= self.trigrams.get(trigram, set())
+            candidates.difference_update(found)
+            found.extend(self._finder(query, sorted(candidates), limit - len(found)))
+
+        if not found:
+            # the full scan is the slow path so it's only for queries that the index knows nothing about
+            found = self._finder(query, range(len(self.items)), limit)
+
+        return [self.items[index] for index in found]
+
+    def _finder(self, query: str, indexes: Iterable[int], limit: int) -> list[int]:
+        """Same ranking as `finder`: subsequence matches sorted by the match length and the match start."""
+        regex = re.compile(".*?".join(map(re.escape, query)))
+        best: dict[int, tuple[int, int]] = {}
+        for index in indexes:
+            for name in self.names[index]:
+                if (r := regex.search(name)) and (index not in best or (len(r.group()), r.start()) < best[index]):
+                    best[index] = (len(r.group()), r.start())
+        return heapq.nsmallest(limit, best, key=lambda index: (*best[index], index))
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, TypedDict, override
+from typing import TYPE_CHECKING, Any, TypedDict, override
 
 import discord
 from roleidentification import get_roles
@@ -41,7 +42,7 @@ def cdragon_asset_url(path: str) -> str:
     return BASE_URL + path
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True, frozen=True)
 class Champion(Character):
     alias: str
     """No spaces, no extra symbols, PascalCase-like name for the champion,
@@ -54,7 +55,7 @@ class Champion(Character):
     """
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True, frozen=True)
 class PseudoChampion(Character):
     alias: str
     icon_url: str
@@ -95,8 +96,21 @@ class Champions(CharacterStorage[Champion, PseudoChampion]):
         data.pop(-1, None)
         return data
 
+    @override
+    def load_value(self, raw: Any) -> Champion:
+        return self.load_dataclass(Champion, raw)
+
+    @override
+    def get_aliases(self, character: Champion) -> list[str]:
+        return [character.alias]
+
+    @override
+    def get_asset_urls(self) -> list[str]:
+        return [champion.icon_url for champion in self.cached_data.values()]
+
     @override
     @staticmethod
+    @functools.cache
     def generate_unknown_object(champion_id: int) -> PseudoChampion:
         return PseudoChampion(
             id=champion_id,
@@ -151,6 +165,10 @@ class ItemIcons(GameDataStorage[str, str]):
         items = await self.bot.lol.cdragon.get_lol_v1_items()
         return {item["id"]: cdragon_asset_url(item["iconPath"]) for item in items}
 
+    @override
+    def get_asset_urls(self) -> list[str]:
+        return list(self.cached_data.values())
+
     @override
     @staticmethod
     def generate_unknown_object(_: int) -> str:
@@ -175,6 +193,10 @@ class RuneIcons(GameDataStorage[str, str]):
         perks = await self.bot.lol.cdragon.get_lol_v1_perks()
         return {perk["id"]: cdragon_asset_url(perk["iconPath"]) for perk in perks}
 
+    @override
+    def get_asset_urls(self) -> list[str]:
+        return list(self.cached_data.values())
+
     @override
     @staticmethod
     def generate_unknown_object(_: int) -> str:
@@ -198,6 +220,10 @@ class SummonerSpellIcons(GameDataStorage[str, str]):
         summoner_spells = await self.bot.lol.cdragon.get_lol_v1_summoner_spells()
         return {spell["id"]: cdragon_asset_url(spell["iconPath"]) for spell in summoner_spells}
 
+    @override
+    def get_asset_urls(self) -> list[str]:
+        return list(self.cached_data.values())
+
     @override
     @staticmethod
     def generate_unknown_object(_: int) -> str:
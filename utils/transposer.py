@@ -1,23 +1,153 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
+import multiprocessing
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
 from io import BytesIO, StringIO
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, TypedDict
 
 import discord
-from PIL import Image
+import orjson
+from PIL import Image, ImageFont
 
 from . import cache, errors
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     from aiohttp import ClientSession
     from matplotlib.figure import Figure
-    from PIL import ImageFont
 
 log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
 
+class EncodedImage:
+    """Image that is encoded into bytes once and then can be uploaded any amount of times.
+
+    `discord.File` holds a file pointer so it can't be shared between concurrent uploads.
+    `to_file` gives a fresh `discord.File` each time instead. `BytesIO` doesn't copy immutable `bytes`
+    until something writes into it, so these files are just cheap views over the same buffer.
+    """
+
+    __slots__ = ("data", "filename")
+
+    def __init__(self, data: bytes, filename: str) -> None:
+        self.data: bytes = data
+        self.filename: str = filename
+
+    def to_file(self) -> discord.File:
+        """Get a new discord.File view over the encoded image."""
+        return discord.File(fp=BytesIO(self.data), filename=self.filename)
+
+
+class AssetIndexEntry(TypedDict):
+    """Entry of the on-disk asset cache index."""
+
+    sha256: str
+    etag: str | None
+    last_modified: str | None
+
+
+class AssetDiskCache:
+    """Content-addressed on-disk cache for static images like game icons.
+
+    Blobs are saved as files named by sha256 of their content (so identical icons behind different URLs
+    are stored once) and `index.json` maps URLs to blobs together with their `ETag`/`Last-Modified`
+    validators. This way the cache survives restarts and can be cheaply revalidated.
+    """
+
+    def __init__(self, path: str = ".temp/assets/") -> None:
+        self.path: Path = Path(path)
+        self.index_path: Path = self.path / "index.json"
+        self.index: dict[str, AssetIndexEntry] = {}
+        try:
+            self.index = orjson.loads(self.index_path.read_bytes())
+        except FileNotFoundError:
+            pass
+        except orjson.JSONDecodeError:
+            log.warning("Asset cache index is corrupted. Starting from scratch.")
+
+    def blob_path(self, entry: AssetIndexEntry) -> Path:
+        """Path to the file with asset's content."""
+        return self.path / entry["sha256"]
+
+    def read(self, url: str) -> bytes | None:
+        """Read the cached asset. Returns `None` if it's not in the cache."""
+        entry = self.index.get(url)
+        if entry is None:
+            return None
+        try:
+            return self.blob_path(entry).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    async def write(self, url: str, data: bytes, *, etag: str | None, last_modified: str | None) -> None:
+        """Save the asset to the disk and remember it in the index (the index file itself is saved separately)."""
+        entry: AssetIndexEntry = {
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "etag": etag,
+            "last_modified": last_modified,
+        }
+        blob_path = self.blob_path(entry)
+
+        def write_blob() -> None:
+            if not blob_path.exists():
+                self.path.mkdir(parents=True, exist_ok=True)
+                # unique temp name - identical icons behind different URLs can be written concurrently
+                temp_path = blob_path.with_name(f"{blob_path.name}.{uuid.uuid4().hex}.tmp")
+                temp_path.write_bytes(data)
+                temp_path.replace(blob_path)
+
+        await asyncio.to_thread(write_blob)
+        self.index[url] = entry
+
+    async def save_index(self) -> None:
+        """Save the index to the disk."""
+        # dump it here in the event loop thread so the dict doesn't change in the middle of it
+        data = orjson.dumps(self.index)
+
+        def write_index() -> None:
+            self.path.mkdir(parents=True, exist_ok=True)
+            temp_path = self.index_path.with_name(f"{self.index_path.name}.{uuid.uuid4().hex}.tmp")
+            temp_path.write_bytes(data)
+            temp_path.replace(self.index_path)
+
+        await asyncio.to_thread(write_index)
+
+
+def _render_and_encode[T](builder: Callable[[T], Image.Image], spec: T, extension: str) -> bytes:
+    """Build the image from the render spec and encode it.
+
+    This is the function that runs in the render worker (thread or process),
+    so it needs to stay on the module level in order to be picklable.
+    """
+    image_binary = BytesIO()
+    builder(spec).save(image_binary, extension)
+    return image_binary.getvalue()
+
+
+@lru_cache(maxsize=64)
+def _get_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    return ImageFont.truetype(path, size)
+
+
+@lru_cache(maxsize=2048)
+def _get_text_wh(font: ImageFont.FreeTypeFont, text: str) -> tuple[int, int]:
+    # https://stackoverflow.com/a/46220683/9263761
+    # https://levelup.gitconnected.com/how-to-properly-calculate-text-size-in-pil-images-17a2cc6f51fd
+
+    _, descent = font.getmetrics()  # _ is `ascent`
+    _, _, right, bottom = font.getmask(text).getbbox()
+    return right, bottom + descent
+
+
 class TransposeClient:
     """Transpose object of X class to an object of Y class.
 
@@ -29,27 +159,101 @@ class TransposeClient:
 
     # The name is "transpose" because "convert"/"transform" have meanings in discord.py
 
-    def __init__(self, session: ClientSession) -> None:
+    def __init__(self, session: ClientSession, *, render_processes: int = 0) -> None:
+        """Initialize TransposeClient.
+
+        Parameters
+        ----------
+        session: ClientSession
+            aiohttp session used to download images.
+        render_processes: int
+            Amount of worker processes for `render`. Zero means rendering is done in a thread
+            which is fine for a few images, but PIL work holds the GIL so for bigger bursts
+            processes give proper multi-core scaling and keep the event loop responsive.
+
+        """
         self.session: ClientSession = session
+        self.assets: AssetDiskCache = AssetDiskCache()
+        # "spawn" because forking a running multi-threaded asyncio process can deadlock the children
+        # (and it's the only start method on Windows anyway)
+        self.render_executor: ProcessPoolExecutor | None = (
+            ProcessPoolExecutor(max_workers=render_processes, mp_context=multiprocessing.get_context("spawn"))
+            if render_processes
+            else None
+        )
+
+    def close(self) -> None:
+        """Shut down render worker processes (if any)."""
+        if self.render_executor is not None:
+            self.render_executor.shutdown(wait=False, cancel_futures=True)
+            self.render_executor = None
+
+    async def render[T](
+        self,
+        builder: Callable[[T], Image.Image],
+        spec: T,
+        *,
+        filename: str = "fromAluBot.png",
+        extension: str = "PNG",
+    ) -> EncodedImage:
+        """Build an image with `builder(spec)` in a render worker and encode it.
+
+        Parameters
+        ----------
+        builder: Callable[[T], Image.Image]
+            Module-level image builder function. It must not depend on anything but `spec`
+            since it might be sent to another process.
+        spec: T
+            Render spec - plain picklable data that the builder needs: canvas/icon images, texts, colours.
+        filename: str
+            Filename for the resulting EncodedImage.
+        extension: str
+            Encoding format.
+
+        """
+        if self.render_executor is not None:
+            loop = asyncio.get_running_loop()
+            try:
+                data = await loop.run_in_executor(self.render_executor, _render_and_encode, builder, spec, extension)
+            except BrokenProcessPool:
+                log.exception("Render process pool is broken. Falling back to rendering in threads.")
+                self.close()
+            else:
+                return EncodedImage(data, filename=filename)
+
+        data = await asyncio.to_thread(_render_and_encode, builder, spec, extension)
+        return EncodedImage(data, filename=filename)
+
+    @staticmethod
+    def font(path: str, size: int) -> ImageFont.FreeTypeFont:
+        """Get a shared `FreeTypeFont` object for the font file and size.
+
+        Font objects are pooled per process so the font file is read and parsed only once
+        instead of on every render. The same object is returned each time which also makes
+        `get_text_wh` cache hits possible.
+
+        Parameters
+        ----------
+        path
+            Path to the font file, i.e. "./assets/fonts/Inter-Black-slnt=0.ttf".
+        size
+            Font size.
+
+        """
+        return _get_font(path, size)
 
     @staticmethod
     def get_text_wh(text: str, font: ImageFont.FreeTypeFont) -> tuple[int, int]:
         """Get text wh-dimensions for selected font.
 
+        Measurements are LRU-cached by (font, text) so prefer fonts from `TransposeClient.font`.
+
         Returns
         -------
             (width, height) - width and height of the text written in specified font
 
         """
-        # https://stackoverflow.com/a/46220683/9263761
-        # https://levelup.gitconnected.com/how-to-properly-calculate-text-size-in-pil-images-17a2cc6f51fd
-
-        _, descent = font.getmetrics()  # _ is `ascent`
-
-        text_width: int = font.getmask(text).getbbox()[2]
-        text_height: int = font.getmask(text).getbbox()[3] + descent
-
-        return text_width, text_height
+        return _get_text_wh(font, text)
 
     @staticmethod
     def str_to_file(string: str, filename: str = "file.txt") -> discord.File:
@@ -74,6 +278,15 @@ class TransposeClient:
         image_binary.seek(0)
         return discord.File(fp=image_binary, filename=filename)
 
+    @staticmethod
+    def image_to_encoded(
+        image: Image.Image, filename: str = "fromAluBot.png", extension: str = "PNG",
+    ) -> EncodedImage:
+        """Convert PIL.Image.Image to EncodedImage - for files that are going to be uploaded more than once."""
+        image_binary = BytesIO()
+        image.save(image_binary, extension)
+        return EncodedImage(image_binary.getvalue(), filename=filename)
+
     @staticmethod
     async def attachment_to_image(attachment: discord.Attachment) -> Image.Image:
         """Convert discord.Attachment to Image.Image."""
@@ -92,13 +305,102 @@ class TransposeClient:
             # assume it is a local file
             return Image.open(fp=str(url_or_fp))
 
-    @cache.cache(maxsize=256)  # kinda scary
+    async def urls_to_images(self, urls: Iterable[str], *, cached: bool = False) -> dict[str, Image.Image]:
+        """Download several images concurrently.
+
+        Identical URLs are downloaded only once, so the same image object is shared between them -
+        make a copy before drawing on it.
+
+        Returns
+        -------
+        dict[str, Image.Image]
+            Mapping `url -> image`.
+
+        """
+        unique_urls = list(dict.fromkeys(urls))
+        fetch = self.url_to_cached_image if cached else self.url_to_image
+        images = await asyncio.gather(*(fetch(url) for url in unique_urls))
+        return dict(zip(unique_urls, images, strict=True))
+
+    @cache.cache(maxsize=512)  # kinda scary
     async def url_to_cached_image(self, url_or_fp: str) -> Image.Image:
         """Get image for image_url and save it to cache.
 
         Useful because the requests within FPC functionality often request same images over and over.
+        The decoded images are kept in memory LRU cache while the downloaded files are saved
+        into the on-disk asset cache so they survive restarts.
+        Only use it for static images like game icons (the image object is shared so don't draw on it).
+        """
+        if not url_or_fp.startswith(("http://", "https://")):
+            return await self.url_to_image(url_or_fp)
+
+        image = Image.open(BytesIO(await self.url_to_asset_bytes(url_or_fp)))
+        image.load()
+        return image
+
+    async def url_to_asset_bytes(self, url: str, *, revalidate: bool = False, save_index: bool = True) -> bytes:
+        """Get bytes of a static image asset, going through the on-disk asset cache.
+
+        Parameters
+        ----------
+        url: str
+            URL of the asset.
+        revalidate: bool
+            Whether to ask the server if our cached copy is still fresh (using `ETag`/`Last-Modified`).
+            Otherwise, the cached copy is used as it is.
+        save_index: bool
+            Whether to save the asset cache index right away. Batch operations do it once in the end instead.
+
         """
-        return await self.url_to_image(url_or_fp)
+        cached = await asyncio.to_thread(self.assets.read, url)
+        entry = self.assets.index.get(url)
+        headers: dict[str, str] = {}
+        if cached is not None and entry is not None:
+            if not revalidate:
+                return cached
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        async with self.session.get(url, headers=headers) as response:
+            if response.status == 304 and cached is not None:
+                return cached
+            if response.ok:
+                data = await response.read()
+                await self.assets.write(
+                    url,
+                    data,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                )
+                if save_index:
+                    await self.assets.save_index()
+                if cached is not None and data != cached:
+                    # the asset was updated so the decoded image in the memory cache is outdated now.
+                    TransposeClient.url_to_cached_image.invalidate(self, url)
+                return data
+            msg = f"`transposer.url_to_asset_bytes`: Status {response.status} - Could not download file from {url}"
+            raise errors.ResponseNotOK(msg)
+
+    async def prewarm_assets(self, urls: Iterable[str], *, max_concurrency: int = 8) -> None:
+        """Download missing and revalidate already cached assets in the on-disk asset cache.
+
+        Meant to be called on `GameDataStorage` refreshes so icons are ready before the first notification.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def prewarm(url: str) -> None:
+            async with semaphore:
+                await self.url_to_asset_bytes(url, revalidate=True, save_index=False)
+
+        unique_urls = [url for url in dict.fromkeys(urls) if url.startswith(("http://", "https://"))]
+        results = await asyncio.gather(*(prewarm(url) for url in unique_urls), return_exceptions=True)
+        await self.assets.save_index()
+
+        failed = sum(isinstance(result, Exception) for result in results)
+        if failed:
+            log.warning("Failed to pre-warm %s/%s assets.", failed, len(unique_urls))
 
     async def url_to_file(self, url: str, filename: str = "fromAluBot.png") -> discord.File:
         """Convert URL to discord.File."""